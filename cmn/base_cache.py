@@ -5,7 +5,7 @@ from django.core.cache import caches
 
 # Internal
 from abc import ABC, abstractmethod
-from typing import Any, Callable, Optional, TYPE_CHECKING
+from typing import Any, Callable, Dict, Iterable, Optional, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from django.core.cache.backends.base import BaseCache
@@ -25,16 +25,36 @@ class AbstractCacheManager(ABC):
         """Set an item in cache."""
         pass
 
+    @abstractmethod
+    def get_many(self, keys: Iterable[str]) -> Dict[str, Any]:
+        """Retrieve several items from cache in a single round-trip."""
+        pass
+
+    @abstractmethod
+    def set_many(self, data: Dict[str, Any], timeout: Optional[int] = None) -> None:
+        """Set several items in cache in a single round-trip."""
+        pass
+
     @abstractmethod
     def get_or_set(self, key: str, default: Callable[[], Any], timeout: Optional[int] = None) -> Any:
         """Retrieve an item from cache or set it if not present."""
         pass
 
+    @abstractmethod
+    def add(self, key: str, value: Any, timeout: Optional[int] = None) -> bool:
+        """Set an item only if the key is absent; return whether it was stored."""
+        pass
+
     @abstractmethod
     def delete(self, key: str) -> None:
         """Delete an item from cache."""
         pass
 
+    @abstractmethod
+    def delete_many(self, keys: Iterable[str]) -> None:
+        """Delete several items from cache in a single round-trip."""
+        pass
+
     @abstractmethod
     def incr(self, key: str, delta: int = 1) -> int:
         """Increment a cache value atomically."""
@@ -68,16 +88,36 @@ class CacheManager(AbstractCacheManager):
         self._get_cache().set(key, value, timeout or self.CACHE_TIMEOUT)
 
 
+    def get_many(self, keys: Iterable[str]) -> Dict[str, Any]:
+        """Retrieve several items from cache; missing keys are omitted from the result."""
+        return self._get_cache().get_many(keys)
+
+
+    def set_many(self, data: Dict[str, Any], timeout: Optional[int] = None) -> None:
+        """Set several items in cache in a single round-trip."""
+        self._get_cache().set_many(data, timeout or self.CACHE_TIMEOUT)
+
+
     def get_or_set(self, key: str, default: Callable[[], Any], timeout: Optional[int] = None) -> Any:
         """Retrieve an item from cache or set it if not present."""
         return self._get_cache().get_or_set(key, default, timeout or self.CACHE_TIMEOUT)
 
 
+    def add(self, key: str, value: Any, timeout: Optional[int] = None) -> bool:
+        """Set an item only if the key is absent (atomic on memcached/Redis); return whether it was stored."""
+        return self._get_cache().add(key, value, timeout or self.CACHE_TIMEOUT)
+
+
     def delete(self, key: str) -> None:
         """Delete an item from cache."""
         self._get_cache().delete(key)
 
 
+    def delete_many(self, keys: Iterable[str]) -> None:
+        """Delete several items from cache in a single round-trip."""
+        self._get_cache().delete_many(keys)
+
+
     def incr(self, key: str, delta: int = 1) -> int:
         """Increment a cache value atomically, defaulting to 1 if key does not exist."""
 
@@ -95,6 +135,50 @@ class CacheManager(AbstractCacheManager):
 
 
 
+class NullCacheManager(AbstractCacheManager):
+    """No-op cache manager for repositories with caching disabled: every read misses, writes are dropped."""
+
+
+    def get(self, key: str) -> Optional[Any]:
+        return None
+
+
+    def set(self, key: str, value: Any, timeout: Optional[int] = None) -> None:
+        pass
+
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, Any]:
+        return {}
+
+
+    def set_many(self, data: Dict[str, Any], timeout: Optional[int] = None) -> None:
+        pass
+
+
+    def get_or_set(self, key: str, default: Callable[[], Any], timeout: Optional[int] = None) -> Any:
+        return default() if callable(default) else default
+
+
+    def add(self, key: str, value: Any, timeout: Optional[int] = None) -> bool:
+        return True
+
+
+    def delete(self, key: str) -> None:
+        pass
+
+
+    def delete_many(self, keys: Iterable[str]) -> None:
+        pass
+
+
+    def incr(self, key: str, delta: int = 1) -> int:
+        return delta
+
+
+    def clear(self) -> None:
+        pass
+
+
 # class RedisCacheManager(AbstractCacheManager):
 #     """Cache manager using Redis directly for high-performance needs."""
 #
@@ -1,16 +1,87 @@
 from __future__ import annotations
 
 # External
-from django.db import models, transaction
+from django.db import connections, models, router, transaction
+from django.db.models.query import QuerySet
 
 # Internal
+import hashlib
+import json
+import re
+import time
+from functools import cached_property, lru_cache
+from itertools import islice
 from abc import ABC, abstractmethod
-from typing import Optional, List, Type, TypeVar, Generic, Tuple, ClassVar, Dict, Any, Iterator
-from .base_cache import CacheManager
+from typing import Optional, List, Type, TypeVar, Generic, Tuple, ClassVar, Dict, Any, Iterator, Callable, Iterable, Sequence, Set
+from .base_cache import AbstractCacheManager, CacheManager, NullCacheManager
 from .base_model import DBManager, logger
 
 T = TypeVar("T", bound=models.Model)
 
+# Cached in place of an entity to remember that an ID does not exist (pickle-safe)
+_CACHE_MISS = "__MISS__"
+
+# Cached in place of a collection above CACHE_COLLECTION_MAX_ITEMS, so later misses query
+# straight away instead of waiting on a fill that will never be cached (pickle-safe)
+_CACHE_TOO_LARGE = "__TOO_LARGE__"
+
+# Substrings that mark a field as sensitive in log output (matched case-insensitively)
+_SENSITIVE_KEY_RE = re.compile(r"password|token|secret|key|auth|credential", re.IGNORECASE)
+
+
+def _check_fields_tuple(fields: Tuple[Any, ...], operation: str) -> Tuple[str, ...]:
+    """Validate that every field name is a non-empty string and return them stripped."""
+
+    for i, field in enumerate(fields):
+        if not isinstance(field, str) or not field.strip():
+            raise ValueError(
+                f"Field at index {i} must be a non-empty string, got {type(field).__name__}"
+            )
+    return tuple(field.strip() for field in fields)
+
+
+_validate_fields_tuple = lru_cache(maxsize=128)(_check_fields_tuple)
+
+
+@lru_cache(maxsize=None)
+def _cache_key_prefix(model: Type[models.Model]) -> str:
+    """Return the "{app_label}.{model_name}" cache-key prefix, computed once per model class."""
+
+    app_label = getattr(model._meta, 'app_label', 'default')
+    return f"{app_label}.{model.__name__.lower()}"
+
+
+@lru_cache(maxsize=1024)
+def _is_sensitive_key(key: str) -> bool:
+    """Return whether a field name marks a sensitive value; field names recur, so results are memoized."""
+    return _SENSITIVE_KEY_RE.search(key) is not None
+
+
+def _truncate_log_value(value: Any) -> Any:
+    """Truncate long strings for log output; other values pass through."""
+
+    if isinstance(value, str) and len(value) > 100:
+        return value[:100] + "...[TRUNCATED]"
+    return value
+
+
+class _LazySanitized:
+    """Defers log sanitization until the log record is actually formatted, then reuses the result."""
+
+    __slots__ = ("data", "sanitize", "_rendered")
+
+    def __init__(self, data: Any, sanitize: Callable[[Any], Any]) -> None:
+        self.data = data
+        self.sanitize = sanitize
+        self._rendered: Optional[str] = None
+
+    def __str__(self) -> str:
+        if self._rendered is None:
+            self._rendered = str(self.sanitize(self.data))
+        return self._rendered
+
+    __repr__ = __str__
+
 
 class Repository(ABC):
     """Abstract class that defines the contract for repositories."""
@@ -43,7 +114,7 @@ class Repository(ABC):
 
 
     @abstractmethod
-    def create_entity(self, **kwargs) -> Optional[T]:
+    def create_entity(self, data: Optional[Dict[str, Any]] = None, /, **kwargs) -> Optional[T]:
         """Create a new entity."""
         pass
 
@@ -84,12 +155,54 @@ class BaseRepository(Repository, Generic[T]):
        Subclasses must define a `_model` class attribute pointing to a Django model."""
 
     CACHE_TIMEOUT = 60 * 15
+    CACHE_VERSION_TIMEOUT = 60 * 60 * 24
+    CACHE_COLLECTION_MAX_ITEMS = 500
+    NEGATIVE_CACHE_TIMEOUT = 60
+    # A miss is filled by one caller at a time; others poll briefly for its result before querying
+    CACHE_FILL_LOCK_TIMEOUT = 10
+    CACHE_FILL_WAIT_ATTEMPTS = 5
+    CACHE_FILL_WAIT_INTERVAL = 0.02
+    # Writes bump the collection version, but without a shared CACHES backend each process has its own
+    # LocMemCache and never sees another worker's bump; the TTL bounds how stale a count can get
+    COUNT_CACHE_TIMEOUT = CACHE_TIMEOUT
+    # Below this many rows an exact COUNT(*) is cheap and planner estimates are least reliable
+    ESTIMATE_COUNT_MIN_ROWS = 10_000
+    # Cheap counts are recounted soon, bounding staleness from writes that bypass the repository
+    SMALL_COUNT_CACHE_TIMEOUT = 60
+    # Planner estimates drift with every write and autovacuum; reuse one only briefly
+    ESTIMATE_CACHE_TIMEOUT = 60
+    LOG_SANITIZE_MAX_DEPTH = 4
+    DEEP_PAGE_OFFSET_THRESHOLD = 10_000
+    # Rows per multi-row INSERT; capped so one statement stays under PostgreSQL's bind-parameter limit
+    BULK_CREATE_BATCH_SIZE = 1000
+    MAX_QUERY_PARAMS = 65_535
+    # Rows per CASE-WHEN UPDATE and per atomic block in bulk updates; larger batches mean fewer commits in autocommit
+    BULK_UPDATE_BATCH_SIZE = 500
+    # Primary keys per DELETE ... WHERE pk IN (...) when deleting a list of instances. Raised from the
+    # earlier default of 100 so typical lists go out as one statement; 1000 binds stay far below
+    # MAX_QUERY_PARAMS, and a cascading model's collector runs its related lookups once per batch
+    BULK_DELETE_BATCH_SIZE = 1000
     CACHE_KEY_FORMAT: ClassVar[str] = "{app_label}.{model_name}.{id}"
 
+    # Relations eagerly loaded by reads (FK/OneToOne via JOIN, M2M/reverse FK via one IN query)
+    _select_related: ClassVar[Tuple[str, ...]] = ()
+    _prefetch_related: ClassVar[Tuple[str, ...]] = ()
+
     _model: Type[T] = None
     _cache_enabled: bool = False
-    _cache_manager: CacheManager
+    _cache_manager: AbstractCacheManager
     _manager: Optional[DBManager[T]] = None
+    _key_prefix: str
+    _collection_version_key: str
+
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Build the cache-key prefix at import time for subclasses bound to a fixed `_model`."""
+
+        super().__init_subclass__(**kwargs)
+        if cls._model is not None:
+            cls._key_prefix = _cache_key_prefix(cls._model)
+            cls._collection_version_key = f"{cls._key_prefix}.v"
 
 
     def __init__(self, model: Type[T] = None, cache_enabled: bool = False) -> None:
@@ -99,21 +212,28 @@ class BaseRepository(Repository, Generic[T]):
         if self._model is None:
             raise ValueError("Repository must have a ._model defined")
         self._cache_enabled = cache_enabled
-        self._cache_manager = CacheManager()
+        # Disabled repositories never reach a cache backend, even through direct manager calls
+        self._cache_manager = CacheManager() if cache_enabled else NullCacheManager()
 
+        # Cache keys share the "{app_label}.{model_name}" prefix; subclasses already carry it
+        # from __init_subclass__, so only a different `model` needs one built here
+        if self._model is not type(self)._model or not hasattr(type(self), "_key_prefix"):
+            self._key_prefix = _cache_key_prefix(self._model)
+            self._collection_version_key = f"{self._key_prefix}.v"
 
-    @property
+
+    @cached_property
     def model(self) -> Type[T]:
-        """Return the model class this repository works with."""
+        """Return the model class this repository works with (validated once per instance)."""
 
         if not getattr(self, "_model", None):
             raise ValueError(f"{self.__class__.__name__} must define a `_model` class attribute.")
         return self._model  # type: ignore[return-value]
 
 
-    @property
+    @cached_property
     def manager(self) -> DBManager[T]:
-        """Return the manager instance for the model (lazy loaded with type safety)."""
+        """Return the manager instance for the model (lazy loaded with type safety, validated once)."""
 
         if self._manager is None:
             if not hasattr(self.model, "objects") or not isinstance(self.model.objects, models.Manager):
@@ -132,42 +252,63 @@ class BaseRepository(Repository, Generic[T]):
     def _get_cache_key(self, obj_id: int, suffix: str = "") -> str:
         """Generate a cache key using the defined format with namespace isolation."""
 
-        app_label = getattr(self.model._meta, 'app_label', 'default')
-        model_name = self.model.__name__.lower()
-        
         if suffix:
-            return f"{app_label}.{model_name}.{obj_id}.{suffix}"
-        return f"{app_label}.{model_name}.{obj_id}"
+            return f"{self._key_prefix}.{obj_id}.{suffix}"
+        return f"{self._key_prefix}.{obj_id}"
 
 
     def _get_collection_cache_key(self, suffix: str = "all") -> str:
-        """Generate cache key for collection operations."""
+        """Generate cache key for collection operations, tagged with the current collection version."""
 
-        app_label = getattr(self.model._meta, 'app_label', 'default')
-        model_name = self.model.__name__.lower()
-        return f"{app_label}.{model_name}.{suffix}"
+        if not self._cache_enabled:
+            return f"{self._key_prefix}.{suffix}"
+        return f"{self._key_prefix}.{suffix}.v{self._collection_version()}"
+
+
+    @staticmethod
+    def _new_collection_version() -> int:
+        """Seed for a missing version key: a microsecond timestamp, ahead of any earlier generation.
+
+        Generations only grow by one per write, so a re-created key can only collide with an
+        old one if writes outpaced one per microsecond since that generation was seeded.
+        """
+        return time.time_ns() // 1_000
+
+
+    def _collection_version(self) -> int:
+        """Return the current collection generation, seeding it on first use."""
+
+        version = self._cache_get_or_set(
+            self._collection_version_key,
+            self._new_collection_version,
+            timeout=self.CACHE_VERSION_TIMEOUT
+        )
+        return version or 0
 
 
     @staticmethod
     def _validate_id(obj_id: Any) -> int:
         """Validate and convert ID to integer."""
 
-        if obj_id is None:
-            raise ValueError("ID cannot be None")
-        
-        if isinstance(obj_id, str):
-            if not obj_id.strip():
-                raise ValueError("ID cannot be empty string")
-            if not obj_id.isdigit():
-                raise ValueError(f"Invalid ID format: '{obj_id}' must be a positive integer")
-            obj_id = int(obj_id)
-        
-        if not isinstance(obj_id, int):
-            raise ValueError(f"ID must be an integer, got {type(obj_id).__name__}")
-        
+        # Fast path: plain ints skip the string checks entirely
+        if type(obj_id) is not int:
+            if obj_id is None:
+                raise ValueError("ID cannot be None")
+
+            if isinstance(obj_id, str):
+                # Digits only: int() alone would also accept " 12 ", "+12", "1_000" and "-5"
+                if not obj_id.strip():
+                    raise ValueError("ID cannot be empty string")
+                if not obj_id.isdigit():
+                    raise ValueError(f"Invalid ID format: '{obj_id}' must be a positive integer")
+                obj_id = int(obj_id)
+
+            elif not isinstance(obj_id, int):
+                raise ValueError(f"ID must be an integer, got {type(obj_id).__name__}")
+
         if obj_id <= 0:
             raise ValueError(f"ID must be positive, got {obj_id}")
-        
+
         return obj_id
 
 
@@ -200,6 +341,12 @@ class BaseRepository(Repository, Generic[T]):
         if not instances:
             raise ValueError(f"Empty instances list provided for {operation}")
         
+        # Batches are normally homogeneous: one subclass check on the first element plus exact
+        # type identity checks for the rest; only mixed batches pay the per-element walk
+        first_type = type(instances[0])
+        if issubclass(first_type, models.Model) and all(type(instance) is first_type for instance in instances):
+            return instances
+
         # Validate each instance is of correct type
         for i, instance in enumerate(instances):
             if not isinstance(instance, models.Model):
@@ -219,84 +366,231 @@ class BaseRepository(Repository, Generic[T]):
         
         if not fields:
             raise ValueError(f"Empty fields list provided for {operation}")
-        
-        # Validate each field is a string
-        for i, field in enumerate(fields):
-            if not isinstance(field, str) or not field.strip():
-                raise ValueError(
-                    f"Field at index {i} must be a non-empty string, got {type(field).__name__}"
-                )
-        
-        return [field.strip() for field in fields]
+
+        # The same field set is usually validated over and over, so memoize per tuple
+        try:
+            return list(_validate_fields_tuple(tuple(fields), operation))
+        except TypeError:
+            # Unhashable entries cannot be memoized (and are never valid field names)
+            return list(_check_fields_tuple(tuple(fields), operation))
 
 
     def _sanitize_log_data(self, data: Any) -> Any:
-        """Sanitize sensitive data from logs."""
+        """Sanitize sensitive data from logs.
 
-        if isinstance(data, dict):
-            sanitized = {}
-            sensitive_fields = {'password', 'token', 'secret', 'key', 'api_key', 'auth', 'credential'}
-            
-            for key, value in data.items():
-                if any(sensitive in key.lower() for sensitive in sensitive_fields):
-                    sanitized[key] = "[REDACTED]"
+        Walks nested dicts/lists iteratively; containers nested deeper than
+        LOG_SANITIZE_MAX_DEPTH are replaced with "[DEPTH_LIMIT]".
+        """
+
+        if not isinstance(data, (dict, list, tuple)):
+            return _truncate_log_value(data)
+
+        root = {} if isinstance(data, dict) else []
+        stack = [(data, root, 0)]
+
+        while stack:
+            source, target, depth = stack.pop()
+            is_dict = isinstance(source, dict)
+
+            for key, value in (source.items() if is_dict else enumerate(source)):
+                if is_dict and isinstance(key, str) and _is_sensitive_key(key):
+                    sanitized = "[REDACTED]"
+                elif isinstance(value, (dict, list, tuple)):
+                    if depth + 1 >= self.LOG_SANITIZE_MAX_DEPTH:
+                        sanitized = "[DEPTH_LIMIT]"
+                    else:
+                        # Attach the empty container now so ordering is kept, fill it later
+                        sanitized = {} if isinstance(value, dict) else []
+                        stack.append((value, sanitized, depth + 1))
+                else:
+                    sanitized = _truncate_log_value(value)
+
+                if is_dict:
+                    target[key] = sanitized
                 else:
-                    sanitized[key] = self._sanitize_log_data(value)
-            return sanitized
-        elif isinstance(data, (list, tuple)):
-            return [self._sanitize_log_data(item) for item in data]
-        elif isinstance(data, str) and len(data) > 100:
-            # Truncate long strings
-            return data[:100] + "...[TRUNCATED]"
-        return data
+                    target.append(sanitized)
+
+        return root
 
 
     def _invalidate_collection_caches(self) -> None:
-        """Invalidate all collection-related cache entries."""
+        """Invalidate all collection-related cache entries by bumping the collection version.
+
+        Every collection key embeds the version, so a single INCR orphans all of them
+        (including paginated and filtered variants); stale entries age out via TTL.
+        """
 
         if not self._cache_enabled:
             return
-        
+
         try:
-            # Invalidate common collection cache keys
-            cache_keys = [
-                self._get_collection_cache_key("all"),
-                self._get_collection_cache_key("count"),
-                self._get_collection_cache_key("paginated"),
-            ]
-            
-            for cache_key in cache_keys:
-                self._cache_manager.delete(cache_key)
-                
-        except Exception as e:
-            logger.warning(
-                f"Failed to invalidate collection caches for {self.model.__name__}: {str(e)}"
+            # An expired or evicted version key is re-seeded with a fresh timestamp first;
+            # INCR on a missing key would restart at 1 and serve entries from an old generation
+            self._cache_manager.add(
+                self._collection_version_key, self._new_collection_version(), self.CACHE_VERSION_TIMEOUT
             )
+            self._cache_manager.incr(self._collection_version_key)
 
+        except Exception as e:
+            logger.warning("Failed to invalidate collection caches for %s: %s", self.model.__name__, e)
+
+
+    def _invalidate_after_create(self, instance: T) -> None:
+        """Drop a negative-cache entry left by an earlier lookup of the new ID, then the collections."""
+
+        self._cache_delete(self._get_cache_key(instance.id))
+        self._invalidate_collection_caches()
 
-    def _safe_cache_operation(self, operation: str, key: str, value: Any = None, timeout: int = None) -> Any:
-        """Safely perform cache operations with error handling."""
+
+    def _cache_get(self, key: str) -> Any:
+        """Safely read a cache key; returns None when caching is disabled or fails."""
 
         if not self._cache_enabled:
             return None
         try:
-            if operation == "get":
-                return self._cache_manager.get(key)
-            elif operation == "set":
-                self._cache_manager.set(key, value, timeout or self.CACHE_TIMEOUT)
-                return True
-            elif operation == "delete":
-                self._cache_manager.delete(key)
-                return True
-            elif operation == "get_or_set":
-                return self._cache_manager.get_or_set(key, value, timeout or self.CACHE_TIMEOUT)
+            return self._cache_manager.get(key)
         except Exception as e:
-            logger.warning(
-                f"Cache {operation} operation failed for key '{key}': {str(e)}"
-            )
+            logger.warning("Cache get operation failed for key '%s': %s", key, e)
+            return None
+
+
+    def _cache_set(self, key: str, value: Any, timeout: int = None) -> Optional[bool]:
+        """Safely write a cache key."""
+
+        if not self._cache_enabled:
+            return None
+        try:
+            self._cache_manager.set(key, value, timeout or self.CACHE_TIMEOUT)
+            return True
+        except Exception as e:
+            logger.warning("Cache set operation failed for key '%s': %s", key, e)
+            return None
+
+
+    def _cache_delete(self, key: str) -> Optional[bool]:
+        """Safely delete a cache key."""
+
+        if not self._cache_enabled:
+            return None
+        try:
+            self._cache_manager.delete(key)
+            return True
+        except Exception as e:
+            logger.warning("Cache delete operation failed for key '%s': %s", key, e)
+            return None
+
+
+    def _cache_get_or_set(self, key: str, default: Any, timeout: int = None) -> Any:
+        """Safely read a cache key, storing `default` (value or callable) when it is missing."""
+
+        if not self._cache_enabled:
+            return None
+        try:
+            return self._cache_manager.get_or_set(key, default, timeout or self.CACHE_TIMEOUT)
+        except Exception as e:
+            logger.warning("Cache get_or_set operation failed for key '%s': %s", key, e)
             return None
 
 
+    def _cache_add(self, key: str, value: Any, timeout: int = None) -> bool:
+        """Safely add a cache key if absent; a failing cache counts as stored so callers proceed."""
+
+        if not self._cache_enabled:
+            return True
+        try:
+            return bool(self._cache_manager.add(key, value, timeout or self.CACHE_TIMEOUT))
+        except Exception as e:
+            logger.warning("Cache add operation failed for key '%s': %s", key, e)
+            return True
+
+
+    def _fill_cache_once(self, key: str, load: Callable[[], Any]) -> Any:
+        """
+        Run `load` for a cache miss while holding a short add()-based lock on the key.
+
+        Concurrent misses for the same key wait for the lock holder's cache write instead of
+        all querying the database; if it does not appear in time, or the holder cached
+        `_CACHE_TOO_LARGE`, they run `load` themselves.
+
+        Args:
+            key: The cache key being filled
+            load: Fetches the value from the database and writes it to the cache
+
+        Returns:
+            The value returned by `load`, or the value another caller cached while we waited
+        """
+        if not self._cache_enabled:
+            return load()
+
+        lock_key = f"{key}.lock"
+        if self._cache_add(lock_key, 1, timeout=self.CACHE_FILL_LOCK_TIMEOUT):
+            try:
+                return load()
+            finally:
+                self._cache_delete(lock_key)
+
+        for _ in range(self.CACHE_FILL_WAIT_ATTEMPTS):
+            time.sleep(self.CACHE_FILL_WAIT_INTERVAL)
+            cached = self._cache_get(key)
+            if cached == _CACHE_TOO_LARGE:
+                break
+            if cached is not None:
+                return cached
+        return load()
+
+
+    def _safe_cache_operation(self, operation: str, key: str, value: Any = None, timeout: int = None) -> Any:
+        """Safely perform a cache operation by name (kept for callers outside the hot paths)."""
+
+        if operation == "get":
+            return self._cache_get(key)
+        elif operation == "set":
+            return self._cache_set(key, value, timeout)
+        elif operation == "delete":
+            return self._cache_delete(key)
+        elif operation == "get_or_set":
+            return self._cache_get_or_set(key, value, timeout)
+        return None
+
+
+    def _safe_cache_mget(self, keys: List[str]) -> Dict[str, Any]:
+        """Safely fetch several cache keys in one round-trip."""
+
+        if not self._cache_enabled or not keys:
+            return {}
+        try:
+            return self._cache_manager.get_many(keys) or {}
+        except Exception as e:
+            logger.warning("Cache get_many operation failed for %d keys: %s", len(keys), e)
+            return {}
+
+
+    def _safe_cache_mset(self, data: Dict[str, Any], timeout: int = None) -> bool:
+        """Safely store several cache entries in one round-trip."""
+
+        if not self._cache_enabled or not data:
+            return False
+        try:
+            self._cache_manager.set_many(data, timeout or self.CACHE_TIMEOUT)
+            return True
+        except Exception as e:
+            logger.warning("Cache set_many operation failed for %d keys: %s", len(data), e)
+            return False
+
+
+    def _safe_cache_delete_many(self, keys: List[str]) -> bool:
+        """Safely delete several cache keys in one round-trip."""
+
+        if not self._cache_enabled or not keys:
+            return False
+        try:
+            self._cache_manager.delete_many(keys)
+            return True
+        except Exception as e:
+            logger.warning("Cache delete_many operation failed for %d keys: %s", len(keys), e)
+            return False
+
+
     def get_entity_by_id(self, obj_id: int) -> Optional[T]:
         """Fetch a single model instance by its ID with caching and comprehensive validation.
         
@@ -314,22 +608,33 @@ class BaseRepository(Repository, Generic[T]):
             cache_key = self._get_cache_key(validated_id)
             
             # Try cache first
-            cached_instance = self._safe_cache_operation("get", cache_key)
+            cached_instance = self._cache_get(cache_key)
+            if cached_instance == _CACHE_MISS:
+                logger.debug(f"Negative cache hit for {self.model.__name__} ID={validated_id}")
+                return None
             if cached_instance is not None:
                 logger.debug(f"Cache hit for {self.model.__name__} ID={validated_id}")
                 return cached_instance
             
-            # Fetch from database
-            instance = self.manager.get_by_id(validated_id)
-            
-            # Cache the result if found
-            if instance is not None:
-                self._safe_cache_operation("set", cache_key, instance)
-                logger.debug(f"Fetched and cached {self.model.__name__} ID={validated_id}")
-            else:
-                logger.debug(f"{self.model.__name__} with ID={validated_id} not found")
-            
-            return instance
+            def load() -> Optional[T]:
+                # Fetch from database
+                if self._select_related or self._prefetch_related:
+                    loaded = self._get_queryset().filter(id=validated_id).first()
+                else:
+                    loaded = self.manager.get_by_id(validated_id)
+
+                # Cache the result if found
+                if loaded is not None:
+                    self._cache_set(cache_key, loaded)
+                    logger.debug(f"Fetched and cached {self.model.__name__} ID={validated_id}")
+                else:
+                    # Remember the miss briefly so hot missing IDs don't hammer the DB
+                    self._cache_set(cache_key, _CACHE_MISS, timeout=self.NEGATIVE_CACHE_TIMEOUT)
+                    logger.debug(f"{self.model.__name__} with ID={validated_id} not found")
+                return loaded
+
+            instance = self._fill_cache_once(cache_key, load)
+            return None if instance == _CACHE_MISS else instance
             
         except ValueError:
             # Re-raise validation errors
@@ -343,13 +648,75 @@ class BaseRepository(Repository, Generic[T]):
             raise ValueError(f"Failed to fetch entity by ID: {str(e)}") from e
 
 
-    def get_all_entities(self, limit: Optional[int] = None, offset: int = 0) -> List[T]:
+    def get_entities_by_ids(self, obj_ids: List[int]) -> List[T]:
+        """
+        Fetch several entities by ID using one cache round-trip and one query for misses.
+
+        Args:
+            obj_ids: IDs of the entities to fetch
+
+        Returns:
+            List of found entities in the order of the requested IDs (missing IDs are skipped)
+
+        Raises:
+            ValueError: If any ID is invalid or data retrieval fails
+        """
+        try:
+            validated_ids = [BaseRepository._validate_id(obj_id) for obj_id in obj_ids]
+            keys = {obj_id: self._get_cache_key(obj_id) for obj_id in validated_ids}
+
+            # One MGET for every requested key
+            cached = self._safe_cache_mget(list(keys.values()))
+            found = {obj_id: cached[key] for obj_id, key in keys.items() if key in cached}
+            known_missing = {obj_id for obj_id, entity in found.items() if entity == _CACHE_MISS}
+            for obj_id in known_missing:
+                del found[obj_id]
+
+            # One query for everything the cache did not have
+            missing_ids = [
+                obj_id for obj_id in validated_ids if obj_id not in found and obj_id not in known_missing
+            ]
+            if missing_ids:
+                fetched = {entity.id: entity for entity in self.manager.filter_by(id__in=missing_ids)}
+                found.update(fetched)
+                self._safe_cache_mset({keys[obj_id]: entity for obj_id, entity in fetched.items()})
+
+                # Remember IDs the database does not have, as get_entity_by_id does
+                self._safe_cache_mset(
+                    {keys[obj_id]: _CACHE_MISS for obj_id in missing_ids if obj_id not in fetched},
+                    timeout=self.NEGATIVE_CACHE_TIMEOUT
+                )
+
+            logger.debug(
+                f"Fetched {len(found)}/{len(validated_ids)} {self.model.__name__} instances "
+                f"({len(validated_ids) - len(missing_ids)} from cache)"
+            )
+            return [found[obj_id] for obj_id in validated_ids if obj_id in found]
+
+        except ValueError:
+            raise
+        except Exception as e:
+            logger.error(
+                f"Failed to fetch {self.model.__name__} instances by IDs: {str(e)}",
+                exc_info=True
+            )
+            raise ValueError(f"Failed to fetch entities by IDs: {str(e)}") from e
+
+
+    def get_all_entities(self,
+                         limit: Optional[int] = None,
+                         offset: int = 0,
+                         select_related: Optional[Sequence[str]] = None,
+                         prefetch_related: Optional[Sequence[str]] = None
+    ) -> List[T]:
         """
         Fetch all instances with optional caching and pagination support.
         
         Args:
             limit: Maximum number of entities to return (None for all)
             offset: Number of entities to skip
+            select_related: Relations to JOIN for this call (defaults to the repository's `_select_related`)
+            prefetch_related: Relations to prefetch for this call (defaults to `_prefetch_related`)
             
         Returns:
             List of entity instances
@@ -366,26 +733,43 @@ class BaseRepository(Repository, Generic[T]):
             if not isinstance(offset, int) or offset < 0:
                 raise ValueError(f"Offset must be a non-negative integer, got {offset}")
             
-            # Generate cache key based on pagination
+            # Generate cache key based on pagination and any per-call eager loading, so instances
+            # loaded with different relations never share an entry
             cache_suffix = f"all.limit_{limit}.offset_{offset}" if limit else "all"
+            if select_related is not None:
+                cache_suffix += f".sr_{','.join(select_related)}"
+            if prefetch_related is not None:
+                cache_suffix += f".pr_{','.join(prefetch_related)}"
             cache_key = self._get_collection_cache_key(cache_suffix)
             
             # Try cache first
-            if self._cache_enabled:
-                cached_entities = self._safe_cache_operation("get", cache_key)
-                if cached_entities is not None:
+            cached_entities = self._cache_get(cache_key)
+            if cached_entities == _CACHE_TOO_LARGE:
+                # Known to exceed CACHE_COLLECTION_MAX_ITEMS: query without taking the fill lock
+                return self._fetch_all_entities(limit, offset, select_related, prefetch_related)
+            if cached_entities is not None:
+                logger.debug(
+                    f"Cache hit for {self.model.__name__} collection (limit={limit}, offset={offset})"
+                )
+                return cached_entities
+            
+            def load() -> List[T]:
+                # Fetch from database
+                fetched = self._fetch_all_entities(limit, offset, select_related, prefetch_related)
+
+                # Cache the result only when it is small enough to be worth pickling; otherwise
+                # leave a marker so waiting and later callers query at once
+                if len(fetched) <= self.CACHE_COLLECTION_MAX_ITEMS:
+                    self._cache_set(cache_key, fetched, timeout=600)
+                else:
+                    self._cache_set(cache_key, _CACHE_TOO_LARGE, timeout=600)
                     logger.debug(
-                        f"Cache hit for {self.model.__name__} collection (limit={limit}, offset={offset})"
+                        f"Skipped caching {len(fetched)} {self.model.__name__} instances "
+                        f"(limit is {self.CACHE_COLLECTION_MAX_ITEMS})"
                     )
-                    return cached_entities
-            
-            # Fetch from database
-            entities = self._fetch_all_entities(limit, offset)
-            
-            # Cache the result
-            self._safe_cache_operation("set", cache_key, entities, timeout=600)
-            
-            return entities
+                return fetched
+
+            return self._fill_cache_once(cache_key, load)
             
         except ValueError:
             raise
@@ -397,18 +781,110 @@ class BaseRepository(Repository, Generic[T]):
             raise ValueError(f"Failed to fetch instances: {str(e)}") from e
 
 
-    def _fetch_all_entities(self, limit: Optional[int] = None, offset: int = 0) -> List[T]:
-        """Internal method to fetch entities from database with pagination."""
+    def get_all_entities_as_dicts(self,
+                                  fields: Tuple[str, ...],
+                                  limit: Optional[int] = None,
+                                  offset: int = 0
+    ) -> List[Dict[str, Any]]:
+        """
+        Fetch rows as plain dicts via `.values()`, skipping model instantiation.
 
+        Args:
+            fields: Field names to project
+            limit: Maximum number of rows to return (None for all)
+            offset: Number of rows to skip
+
+        Returns:
+            List of dicts keyed by the requested field names
+
+        Raises:
+            ValueError: If parameters are invalid or data retrieval fails
+        """
         try:
-            queryset = self.manager.get_all()
-            
-            if offset > 0:
-                queryset = queryset[offset:]
-            
+            validated_fields = BaseRepository._validate_fields_list(list(fields), "values projection")
+
             if limit is not None:
-                queryset = queryset[:limit]
-            
+                if not isinstance(limit, int) or limit <= 0:
+                    raise ValueError(f"Limit must be a positive integer, got {limit}")
+
+            if not isinstance(offset, int) or offset < 0:
+                raise ValueError(f"Offset must be a non-negative integer, got {offset}")
+
+            cache_key = self._get_collection_cache_key(
+                f"values_{','.join(sorted(validated_fields))}.limit_{limit}.offset_{offset}"
+            )
+            cached_rows = self._cache_get(cache_key)
+            if cached_rows is not None:
+                logger.debug(f"Cache hit for {self.model.__name__} values (fields: {validated_fields})")
+                return cached_rows
+
+            queryset = self._slice_queryset(
+                self._stably_ordered(self.manager.get_all()).values(*validated_fields), limit, offset
+            )
+            rows = list(queryset)
+
+            if len(rows) <= self.CACHE_COLLECTION_MAX_ITEMS:
+                self._cache_set(cache_key, rows, timeout=600)
+
+            return rows
+
+        except ValueError:
+            raise
+        except Exception as e:
+            logger.error(
+                f"Failed to fetch {self.model.__name__} values: {str(e)}",
+                exc_info=True
+            )
+            raise ValueError(f"Failed to fetch values: {str(e)}") from e
+
+
+    def _get_queryset(self,
+                      select_related: Optional[Sequence[str]] = None,
+                      prefetch_related: Optional[Sequence[str]] = None
+    ) -> QuerySet[T]:
+        """Return the base read queryset with eager loading applied (per-call or the repository's hooks)."""
+
+        select_related = self._select_related if select_related is None else select_related
+        prefetch_related = self._prefetch_related if prefetch_related is None else prefetch_related
+
+        queryset = self.manager.get_all()
+        if select_related:
+            queryset = queryset.select_related(*select_related)
+        if prefetch_related:
+            queryset = queryset.prefetch_related(*prefetch_related)
+        return queryset
+
+
+    @staticmethod
+    def _stably_ordered(queryset: QuerySet) -> QuerySet:
+        """Order by pk unless an ordering is already set, so LIMIT/OFFSET pages neither repeat nor skip rows."""
+
+        return queryset if queryset.ordered else queryset.order_by('pk')
+
+
+    @staticmethod
+    def _slice_queryset(queryset: QuerySet, limit: Optional[int], offset: int) -> QuerySet:
+        """Apply limit/offset as one slice so Django emits a single LIMIT/OFFSET clause."""
+
+        if limit is not None:
+            return queryset[offset:offset + limit]
+        if offset > 0:
+            return queryset[offset:]
+        return queryset
+
+
+    def _fetch_all_entities(self,
+                            limit: Optional[int] = None,
+                            offset: int = 0,
+                            select_related: Optional[Sequence[str]] = None,
+                            prefetch_related: Optional[Sequence[str]] = None
+    ) -> List[T]:
+        """Internal method to fetch entities from database with pagination."""
+
+        try:
+            queryset = self._slice_queryset(
+                self._stably_ordered(self._get_queryset(select_related, prefetch_related)), limit, offset
+            )
             entities = list(queryset)
             logger.debug(
                 f"Successfully fetched {len(entities)} {self.model.__name__} instances "
@@ -424,12 +900,21 @@ class BaseRepository(Repository, Generic[T]):
             raise
 
 
-    def get_entities_iterator(self, batch_size: int = 100) -> Iterator[T]:
+    def get_entities_iterator(self, batch_size: int = 100, warm_cache: bool = False) -> Iterator[T]:
         """
         Memory-efficient iterator for processing large datasets.
+
+        Streams rows through a single `QuerySet.iterator()` (a server-side cursor on
+        PostgreSQL) instead of issuing one query per batch. Iterate to completion or call
+        `.close()` on the generator so the cursor is released promptly.
+
+        A full-table walk would evict the hot per-entity entries, so the cache is left alone
+        unless `warm_cache` is set.
         
         Args:
             batch_size: Number of entities to fetch per batch
+            warm_cache: Store each batch under its per-entity keys, loaded with the same
+                        eager loading as `get_entity_by_id`
             
         Yields:
             Individual entity instances
@@ -441,21 +926,19 @@ class BaseRepository(Repository, Generic[T]):
             raise ValueError(f"Batch size must be a positive integer, got {batch_size}")
         
         try:
-            offset = 0
+            queryset = self._get_queryset() if warm_cache else self.manager.get_all()
+            rows = queryset.iterator(chunk_size=batch_size)
             while True:
-                batch = self._fetch_all_entities(limit=batch_size, offset=offset)
+                batch = list(islice(rows, batch_size))
                 if not batch:
                     break
-                
-                for entity in batch:
-                    yield entity
-                
-                if len(batch) < batch_size:
-                    # Last batch
-                    break
-                
-                offset += batch_size
-                
+
+                if warm_cache:
+                    # Warm per-entity cache keys with a single round-trip per batch
+                    self._safe_cache_mset({self._get_cache_key(entity.id): entity for entity in batch})
+
+                yield from batch
+
         except Exception as e:
             logger.error(
                 f"Error in entities iterator for {self.model.__name__}: {str(e)}",
@@ -464,13 +947,16 @@ class BaseRepository(Repository, Generic[T]):
             raise ValueError(f"Iterator failed: {str(e)}") from e
 
 
-    @transaction.atomic
-    def create_entity(self, **kwargs) -> Optional[T]:
+    def create_entity(self, data: Optional[Dict[str, Any]] = None, /, **kwargs) -> Optional[T]:
         """
         Create an instance with comprehensive validation and cache management.
+
+        Runs in autocommit (a single INSERT); wrap the call in `transaction.atomic()`
+        when it must be atomic with other writes.
         
         Args:
-            **kwargs: Field values for the new entity
+            data: Field values as an existing dict, used as-is instead of unpacking into `**kwargs`
+            **kwargs: Field values for the new entity (ignored when `data` is given)
             
         Returns:
             The created entity instance or None if creation fails
@@ -479,20 +965,23 @@ class BaseRepository(Repository, Generic[T]):
             ValueError: If validation fails or creation fails
         """
         try:
+            # Callers holding a dict pass it positionally and skip the **kwargs repack
+            if data is not None:
+                kwargs = data
+
             # Validate input data
             validated_kwargs = BaseRepository._validate_kwargs(kwargs, "create")
-            sanitized_data = self._sanitize_log_data(validated_kwargs)
-            
-            logger.debug(f"Creating {self.model.__name__} with data: {sanitized_data}")
+            sanitized_data = _LazySanitized(validated_kwargs, self._sanitize_log_data)
+
+            logger.debug("Creating %s with data: %s", self.model.__name__, sanitized_data)
             
             # Create the instance
             instance = self.manager.create_instance(**validated_kwargs)
             
             if not instance:
                 raise ValueError("Failed to create entity - manager returned None")
-            
-            # Invalidate collection caches
-            self._invalidate_collection_caches()
+
+            self._invalidate_after_create(instance)
             
             logger.info(f"Successfully created {self.model.__name__} with ID={instance.id}")
             return instance
@@ -508,10 +997,14 @@ class BaseRepository(Repository, Generic[T]):
             raise ValueError(f"Failed to create entity: {str(e)}") from e
 
 
-    @transaction.atomic
     def update_entity(self, obj_id: int, **kwargs) -> Optional[T]:
         """
         Update an instance with comprehensive validation and cache management.
+
+        The row is loaded with SELECT ... FOR UPDATE and saved in the same transaction, so
+        concurrent updates of one entity apply one after the other instead of overwriting
+        each other. Wrap the call in `transaction.atomic()` when it must be atomic with
+        other writes.
         
         Args:
             obj_id: ID of the entity to update
@@ -527,25 +1020,26 @@ class BaseRepository(Repository, Generic[T]):
             # Validate inputs
             validated_id = BaseRepository._validate_id(obj_id)
             validated_kwargs = BaseRepository._validate_kwargs(kwargs, "update")
-            sanitized_data = self._sanitize_log_data(validated_kwargs)
-            
-            # Retrieve the instance
-            instance = self.manager.get_by_id(validated_id)
-            if not instance:
-                logger.warning(f"Update failed: {self.model.__name__} with ID {validated_id} not found")
-                return None
+            sanitized_data = _LazySanitized(validated_kwargs, self._sanitize_log_data)
             
-            # Perform the update
-            instance.update(**validated_kwargs)
+            # Retrieve the instance under a row lock held until the save commits
+            with transaction.atomic():
+                instance = self.manager.select_for_update().filter(id=validated_id).first()
+                if not instance:
+                    logger.warning(f"Update failed: {self.model.__name__} with ID {validated_id} not found")
+                    return None
+
+                # Perform the update
+                instance.update(**validated_kwargs)
             
             # Clear caches
             cache_key = self._get_cache_key(validated_id)
-            self._safe_cache_operation("delete", cache_key)
+            self._cache_delete(cache_key)
             self._invalidate_collection_caches()
             
             logger.info(
-                f"Successfully updated {self.model.__name__} ID={validated_id} "
-                f"with data: {sanitized_data}"
+                "Successfully updated %s ID=%s with data: %s",
+                self.model.__name__, validated_id, sanitized_data
             )
             
             return instance
@@ -563,10 +1057,13 @@ class BaseRepository(Repository, Generic[T]):
             raise ValueError(f"Update failed: {str(e)}") from e
 
 
-    @transaction.atomic
     def delete_entity(self, obj_id: int) -> Optional[T]:
         """
         Delete an instance with comprehensive validation and cache management.
+
+        Runs in autocommit (Django's delete collector opens its own transaction for
+        cascades); wrap the call in `transaction.atomic()` when it must be atomic with
+        other writes.
         
         Args:
             obj_id: ID of the entity to delete
@@ -592,7 +1089,7 @@ class BaseRepository(Repository, Generic[T]):
             
             # Clear caches
             cache_key = self._get_cache_key(validated_id)
-            self._safe_cache_operation("delete", cache_key)
+            self._cache_delete(cache_key)
             self._invalidate_collection_caches()
             
             logger.info(f"Successfully deleted {self.model.__name__} ID={validated_id}")
@@ -610,14 +1107,103 @@ class BaseRepository(Repository, Generic[T]):
             raise ValueError(f"Deletion failed: {str(e)}") from e
 
 
-    @transaction.atomic
-    def bulk_create_entities(self, instances: List[T], batch_size: int = 100) -> List[T]:
+    def update_entity_fast(self, obj_id: int, **kwargs) -> Optional[int]:
+        """
+        Update an entity with a single UPDATE statement, without loading it first.
+
+        Skips model hooks (`before_update`/`after_update`, `save`) and signals, so use it
+        only when the caller does not need the updated instance.
+
+        Args:
+            obj_id: ID of the entity to update
+            **kwargs: Fields to update
+
+        Returns:
+            Number of updated rows, or None if no entity has that ID
+
+        Raises:
+            ValueError: If validation fails or update fails
+        """
+        try:
+            validated_id = BaseRepository._validate_id(obj_id)
+            validated_kwargs = BaseRepository._validate_kwargs(kwargs, "update")
+
+            updated = self.manager.filter_by(id=validated_id).update(**validated_kwargs)
+            if not updated:
+                logger.warning(f"Update failed: {self.model.__name__} with ID {validated_id} not found")
+                return None
+
+            self._cache_delete(self._get_cache_key(validated_id))
+            self._invalidate_collection_caches()
+
+            logger.info(f"Successfully updated {self.model.__name__} ID={validated_id} (fast path)")
+            return updated
+
+        except ValueError:
+            raise
+        except Exception as e:
+            sanitized_id = self._sanitize_log_data(obj_id)
+            logger.error(
+                f"Failed to update {self.model.__name__} ID={sanitized_id}: {str(e)}",
+                exc_info=True
+            )
+            raise ValueError(f"Update failed: {str(e)}") from e
+
+
+    def delete_entity_fast(self, obj_id: int) -> Optional[int]:
+        """
+        Delete an entity with a single DELETE query, without loading it first.
+
+        Skips the model's `delete()` override, so use it only when the caller does not
+        need the deleted instance.
+
+        Args:
+            obj_id: ID of the entity to delete
+
+        Returns:
+            Number of deleted rows (including cascades), or None if no entity has that ID
+
+        Raises:
+            ValueError: If validation fails or deletion fails
+        """
+        try:
+            validated_id = BaseRepository._validate_id(obj_id)
+
+            deleted, _ = self.manager.filter_by(id=validated_id).delete()
+            if not deleted:
+                logger.warning(f"Delete failed: {self.model.__name__} with ID {validated_id} not found")
+                return None
+
+            self._cache_delete(self._get_cache_key(validated_id))
+            self._invalidate_collection_caches()
+
+            logger.info(f"Successfully deleted {self.model.__name__} ID={validated_id} (fast path)")
+            return deleted
+
+        except ValueError:
+            raise
+        except Exception as e:
+            sanitized_id = self._sanitize_log_data(obj_id)
+            logger.error(
+                f"Failed to delete {self.model.__name__} ID={sanitized_id}: {str(e)}",
+                exc_info=True
+            )
+            raise ValueError(f"Deletion failed: {str(e)}") from e
+
+
+    def bulk_create_entities(self, instances: List[T], batch_size: int = BULK_CREATE_BATCH_SIZE) -> List[T]:
         """
         Bulk create instances with comprehensive validation and efficient cache management.
+
+        Each batch runs in its own atomic block. Called in autocommit mode, every batch
+        commits on its own and a failure in a later batch does not roll back batches
+        already written. Inside an outer transaction (an enclosing `atomic()` or
+        ATOMIC_REQUESTS) the batches join it and commit or roll back with it.
         
         Args:
             instances: List of entity instances to create
-            batch_size: Number of instances to create per batch
+            batch_size: Number of instances to create per batch (one multi-row INSERT each),
+                        lowered if the batch would exceed `MAX_QUERY_PARAMS` bind parameters
             
         Returns:
             List of successfully created instances
@@ -631,15 +1217,22 @@ class BaseRepository(Repository, Generic[T]):
             
             if not isinstance(batch_size, int) or batch_size <= 0:
                 raise ValueError(f"Batch size must be a positive integer, got {batch_size}")
+
+            # Each row binds one parameter per concrete column
+            batch_size = min(batch_size, max(1, self.MAX_QUERY_PARAMS // len(self.model._meta.concrete_fields)))
             
             logger.debug(
                 f"Starting bulk create of {len(validated_instances)} {self.model.__name__} instances"
             )
             
             # Perform bulk creation
-            created_instances = self.manager.bulk_create_instances(
-                validated_instances, batch_size=batch_size
-            )
+            # One atomic block per batch: in autocommit each batch commits alone, keeping memory and locks flat
+            created_instances = []
+            for start in range(0, len(validated_instances), batch_size):
+                with transaction.atomic(savepoint=False):
+                    created_instances.extend(self.manager.bulk_create_instances(
+                        validated_instances[start:start + batch_size], batch_size=batch_size
+                    ))
             
             if not created_instances:
                 raise ValueError("Bulk create failed - no instances were created")
@@ -664,10 +1257,18 @@ class BaseRepository(Repository, Generic[T]):
             raise ValueError(f"Bulk create failed: {str(e)}") from e
 
 
-    @transaction.atomic
-    def bulk_update_entities(self, instances: List[T], fields: List[str], batch_size: int = 100) -> List[T]:
+    def bulk_update_entities(self,
+                             instances: List[T],
+                             fields: List[str],
+                             batch_size: int = BULK_UPDATE_BATCH_SIZE
+    ) -> List[T]:
         """
         Bulk update multiple instances with comprehensive validation and efficient cache management.
+
+        Each batch runs in its own atomic block. Called in autocommit mode, every batch
+        commits on its own and a failure in a later batch does not roll back batches
+        already written. Inside an outer transaction (an enclosing `atomic()` or
+        ATOMIC_REQUESTS) the batches join it and commit or roll back with it.
         
         Args:
             instances: List of entity instances to update
@@ -688,26 +1289,31 @@ class BaseRepository(Repository, Generic[T]):
             if not isinstance(batch_size, int) or batch_size <= 0:
                 raise ValueError(f"Batch size must be a positive integer, got {batch_size}")
             
-            sanitized_fields = self._sanitize_log_data(validated_fields)
+            sanitized_fields = _LazySanitized(validated_fields, self._sanitize_log_data)
             logger.debug(
-                f"Starting bulk update of {len(validated_instances)} {self.model.__name__} instances "
-                f"(fields: {sanitized_fields})"
+                "Starting bulk update of %d %s instances (fields: %s)",
+                len(validated_instances), self.model.__name__, sanitized_fields
             )
             
             # Perform bulk update
-            updated_instances = self.manager.bulk_update_instances(
-                validated_instances, validated_fields, batch_size=batch_size
-            )
+            # One atomic block per batch: in autocommit each batch commits alone, keeping memory and locks flat
+            updated_instances = []
+            for start in range(0, len(validated_instances), batch_size):
+                with transaction.atomic(savepoint=False):
+                    updated_instances.extend(self.manager.bulk_update_instances(
+                        validated_instances[start:start + batch_size], validated_fields, batch_size=batch_size
+                    ))
             
             if not updated_instances:
                 raise ValueError("Bulk update failed - no instances were updated")
-            
-            # Invalidate collection caches (more efficient than individual cache keys)
+
+            # Drop stale per-entity entries in one round-trip, then the collection caches
+            self._safe_cache_delete_many([self._get_cache_key(instance.pk) for instance in updated_instances])
             self._invalidate_collection_caches()
             
             logger.info(
-                f"Successfully updated {len(updated_instances)}/{len(validated_instances)} "
-                f"{self.model.__name__} instances (fields: {sanitized_fields})"
+                "Successfully updated %d/%d %s instances (fields: %s)",
+                len(updated_instances), len(validated_instances), self.model.__name__, sanitized_fields
             )
             
             return updated_instances
@@ -724,19 +1330,23 @@ class BaseRepository(Repository, Generic[T]):
             raise ValueError(f"Bulk update failed: {str(e)}") from e
 
 
-    @transaction.atomic
-    def bulk_delete_entities(self, instances: Optional[List[T]] = None, **filters) -> Tuple[List[T], int]:
+    def bulk_delete_entities(self,
+                             instances: Optional[List[T]] = None,
+                             batch_size: int = BULK_DELETE_BATCH_SIZE,
+                             **filters) -> Tuple[List[T], int]:
         """
         Bulk delete multiple instances with comprehensive validation and efficient cache management.
         
         Args:
-            instances: Optional list of entity instances for validation (can be None if using filters)
-            **filters: Filters to identify instances to delete
+            instances: Optional list of entity instances to delete when no filters are given
+            batch_size: Number of primary keys per `DELETE ... WHERE id IN (...)` when deleting instances
+                (defaults to BULK_DELETE_BATCH_SIZE)
+            **filters: Filters to identify instances to delete (take precedence over `instances`)
             
         Returns:
             Tuple containing:
-            - List of successfully deleted instances
-            - Count of deleted instances
+            - List of instances deleted by filter, or the instances passed in
+            - Count of rows of this model actually deleted
             
         Raises:
             ValueError: If validation fails or bulk deletion fails
@@ -751,23 +1361,39 @@ class BaseRepository(Repository, Generic[T]):
             
             if not isinstance(filters, dict):
                 raise ValueError("Filters must be a dictionary")
+
+            if not isinstance(batch_size, int) or batch_size <= 0:
+                raise ValueError(f"Batch size must be a positive integer, got {batch_size}")
             
-            sanitized_filters = self._sanitize_log_data(filters)
+            sanitized_filters = _LazySanitized(filters, self._sanitize_log_data)
             logger.debug(
-                f"Starting bulk delete of {self.model.__name__} instances "
-                f"(filters: {sanitized_filters})"
+                "Starting bulk delete of %s instances (filters: %s)",
+                self.model.__name__, sanitized_filters
             )
             
             # Perform bulk deletion
-            deleted_instances = self.manager.bulk_delete_instances(**filters)
-            deleted_count = len(deleted_instances)
-            
-            # Invalidate collection caches (more efficient than individual cache keys)
+            with transaction.atomic(savepoint=False):
+                if filters:
+                    deleted_instances = self.manager.bulk_delete_instances(**filters)
+                    deleted_count = len(deleted_instances)
+                else:
+                    # One DELETE per batch of primary keys instead of one per instance; QuerySet.delete()
+                    # skips loading rows when the model has no signals or cascades to emulate
+                    deleted_instances = list(instances)
+                    pks = [instance.pk for instance in deleted_instances]
+                    deleted_count = 0
+                    for start in range(0, len(pks), batch_size):
+                        _, per_model = self.manager.filter_by(pk__in=pks[start:start + batch_size]).delete()
+                        # Rows of this model only: already-deleted pks match nothing and cascades are not ours
+                        deleted_count += per_model.get(self.model._meta.label, 0)
+
+            # Drop per-entity entries in one round-trip, then the collection caches
+            self._safe_cache_delete_many([self._get_cache_key(instance.pk) for instance in deleted_instances])
             self._invalidate_collection_caches()
             
             logger.info(
-                f"Successfully deleted {deleted_count} {self.model.__name__} instances "
-                f"(filters: {sanitized_filters})"
+                "Successfully deleted %d %s instances (filters: %s)",
+                deleted_count, self.model.__name__, sanitized_filters
             )
             
             return deleted_instances, deleted_count
@@ -802,43 +1428,98 @@ class BaseRepository(Repository, Generic[T]):
             if filters and not isinstance(filters, dict):
                 raise ValueError("Filters must be a dictionary")
             
-            # Generate cache key based on filters
-            filters_str = "_".join(f"{k}_{v}" for k, v in sorted(filters.items())) if filters else "all"
-            cache_key = self._get_collection_cache_key(f"count_{filters_str}")
-            
+            # Generate cache key based on filters (a short digest of the canonical JSON for filtered counts)
+            if filters:
+                canonical_filters = json.dumps(filters, sort_keys=True, default=str)
+                filters_digest = hashlib.blake2b(canonical_filters.encode(), digest_size=8).hexdigest()
+                cache_key = self._get_collection_cache_key(f"count_{filters_digest}")
+            else:
+                cache_key = self._get_collection_cache_key("count")
+
             # Try cache first
-            cached_count = self._safe_cache_operation("get", cache_key)
+            cached_count = self._cache_get(cache_key)
             if cached_count is not None:
-                logger.debug(f"Cache hit for {self.model.__name__} count (filters: {filters})")
+                logger.debug(
+                    "Cache hit for %s count (filters: %s)",
+                    self.model.__name__, _LazySanitized(filters, self._sanitize_log_data)
+                )
                 return cached_count
             
-            # Count from database
-            if filters:
-                count = self.manager.filter_by(**filters).count()
-            else:
-                count = self.manager.count()
-            
-            # Cache the result
-            self._safe_cache_operation("set", cache_key, count, timeout=300)  # 5-minute cache
-            
-            logger.debug(f"Counted {count} {self.model.__name__} instances (filters: {filters})")
-            return count
+            def load() -> int:
+                # Count from database as a bare COUNT(*): no ordering, no column list
+                queryset = self.manager.filter_by(**filters) if filters else self.manager.get_all()
+                counted = queryset.order_by().values('pk').count()
+
+                # Cache the result; expensive counts for the regular TTL, cheap ones briefly
+                timeout = (self.COUNT_CACHE_TIMEOUT if counted >= self.ESTIMATE_COUNT_MIN_ROWS
+                           else self.SMALL_COUNT_CACHE_TIMEOUT)
+                self._cache_set(cache_key, counted, timeout=timeout)
+
+                logger.debug(
+                    "Counted %d %s instances (filters: %s)",
+                    counted, self.model.__name__, _LazySanitized(filters, self._sanitize_log_data)
+                )
+                return counted
+
+            # One caller runs the COUNT after a write bumps the version; the rest wait for its result
+            return self._fill_cache_once(cache_key, load)
             
         except ValueError:
             raise
         except Exception as e:
-            sanitized_filters = self._sanitize_log_data(filters)
             logger.error(
-                f"Failed to count {self.model.__name__} instances "
-                f"(filters: {sanitized_filters}): {str(e)}",
+                "Failed to count %s instances (filters: %s): %s",
+                self.model.__name__, _LazySanitized(filters, self._sanitize_log_data), e,
                 exc_info=True
             )
             raise ValueError(f"Count operation failed: {str(e)}") from e
 
 
+    def estimate_count(self) -> Tuple[int, bool]:
+        """
+        Approximate number of entities in the whole table, for dashboards where exactness is not needed.
+
+        A cached exact count is returned when available. Otherwise PostgreSQL's planner statistics
+        (pg_class.reltuples) are used and cached for ESTIMATE_CACHE_TIMEOUT, falling back to the exact
+        `count_entities()` on other databases, on never-analyzed tables, and below ESTIMATE_COUNT_MIN_ROWS.
+
+        Returns:
+            Tuple of (count, approximate), where approximate is True when the count is a planner estimate
+        """
+        cached_count = self._cache_get(self._get_collection_cache_key("count"))
+        if cached_count is not None:
+            return cached_count, False
+
+        estimate_key = self._get_collection_cache_key("estimate")
+        cached_estimate = self._cache_get(estimate_key)
+        if cached_estimate is not None:
+            return cached_estimate, True
+
+        try:
+            connection = connections[router.db_for_read(self.model)]
+            if connection.vendor == 'postgresql':
+                with connection.cursor() as cursor:
+                    # Quoted so mixed-case and schema-qualified db_table values resolve;
+                    # to_regclass() yields no row instead of an error for a missing table
+                    cursor.execute(
+                        "SELECT reltuples::bigint FROM pg_class WHERE oid = to_regclass(%s)",
+                        [connection.ops.quote_name(self.model._meta.db_table)]
+                    )
+                    row = cursor.fetchone()
+                if row and row[0] >= self.ESTIMATE_COUNT_MIN_ROWS:
+                    self._cache_set(estimate_key, row[0], timeout=self.ESTIMATE_CACHE_TIMEOUT)
+                    return row[0], True
+        except Exception as e:
+            logger.warning("Row estimate failed for %s, counting instead: %s", self.model.__name__, e)
+
+        return self.count_entities(), False
+
+
     def exists_entity(self, **filters) -> bool:
         """
         Check if any entities exist with the given filters.
+
+        To check many IDs, use `exists_entities_batch` instead of calling this in a loop.
         
         Args:
             **filters: Filters to check existence
@@ -859,9 +1540,9 @@ class BaseRepository(Repository, Generic[T]):
             # Use manager's exists method for efficiency
             exists = self.manager.exists(**filters)
             
-            sanitized_filters = self._sanitize_log_data(filters)
             logger.debug(
-                f"Existence check for {self.model.__name__} (filters: {sanitized_filters}): {exists}"
+                "Existence check for %s (filters: %s): %s",
+                self.model.__name__, _LazySanitized(filters, self._sanitize_log_data), exists
             )
             
             return exists
@@ -869,10 +1550,45 @@ class BaseRepository(Repository, Generic[T]):
         except ValueError:
             raise
         except Exception as e:
-            sanitized_filters = self._sanitize_log_data(filters)
             logger.error(
-                f"Failed existence check for {self.model.__name__} "
-                f"(filters: {sanitized_filters}): {str(e)}",
+                "Failed existence check for %s (filters: %s): %s",
+                self.model.__name__, _LazySanitized(filters, self._sanitize_log_data), e,
+                exc_info=True
+            )
+            raise ValueError(f"Existence check failed: {str(e)}") from e
+
+
+    def exists_entities_batch(self, obj_ids: Iterable[int]) -> Set[int]:
+        """
+        Check which of the given IDs exist using a single `pk__in` query.
+
+        Args:
+            obj_ids: IDs to check
+
+        Returns:
+            Set of the IDs that exist
+
+        Raises:
+            ValueError: If any ID is invalid or the existence check fails
+        """
+        try:
+            validated_ids = {BaseRepository._validate_id(obj_id) for obj_id in obj_ids}
+            if not validated_ids:
+                return set()
+
+            existing = set(self.manager.filter_by(pk__in=validated_ids).values_list('pk', flat=True))
+
+            logger.debug(
+                "Batch existence check for %s: %d/%d IDs exist",
+                self.model.__name__, len(existing), len(validated_ids)
+            )
+            return existing
+
+        except ValueError:
+            raise
+        except Exception as e:
+            logger.error(
+                f"Failed batch existence check for {self.model.__name__}: {str(e)}",
                 exc_info=True
             )
             raise ValueError(f"Existence check failed: {str(e)}") from e
@@ -893,41 +1609,71 @@ class BaseRepository(Repository, Generic[T]):
                 # Clear specific entity cache
                 validated_id = BaseRepository._validate_id(obj_id)
                 cache_key = self._get_cache_key(validated_id)
-                self._safe_cache_operation("delete", cache_key)
-                logger.debug(f"Cleared cache for {self.model.__name__} ID={validated_id}")
+                self._cache_delete(cache_key)
+                logger.debug("Cleared cache for %s ID=%s", self.model.__name__, validated_id)
             else:
                 # Clear collection caches
                 self._invalidate_collection_caches()
-                logger.debug(f"Cleared collection caches for {self.model.__name__}")
+                logger.debug("Cleared collection caches for %s", self.model.__name__)
                 
         except ValueError:
             raise
         except Exception as e:
             logger.error(
-                f"Failed to clear cache for {self.model.__name__}: {str(e)}",
+                "Failed to clear cache for %s: %s", self.model.__name__, e,
                 exc_info=True
             )
             # Don't raise here - cache clearing is not critical for business logic
 
 
-    def get_paginated_entities(self, page: int = 1, per_page: int = 20, **filters) -> Dict[str, Any]:
+    @staticmethod
+    def _row_pk(row: Any) -> Any:
+        """Primary key of a model instance or of a `.values('pk', ...)` row."""
+        return row['pk'] if isinstance(row, dict) else row.pk
+
+
+    def get_paginated_entities(self,
+                               page: int = 1,
+                               per_page: int = 20,
+                               include_count: bool = False,
+                               after_id: Optional[int] = None,
+                               fields: Optional[List[str]] = None,
+                               **filters
+    ) -> Dict[str, Any]:
         """
         Get paginated entities with comprehensive pagination information.
+
+        By default no COUNT query is issued: the page is fetched with one extra row to
+        tell whether a next page exists. Pass `include_count=True` to also get totals.
+
+        Two paging modes are supported:
+        - Keyset: pass `after_id` (the previous page's `next_cursor`) to read the rows with
+          a greater primary key, ordered by pk. This is an index range scan at any depth.
+        - Page number: rows are sliced with LIMIT/OFFSET. Once the offset reaches
+          DEEP_PAGE_OFFSET_THRESHOLD, the page's pks are read first with an index-only
+          slice and the full rows fetched by `pk__in`, so the skipped rows are never loaded.
+
+        Pass `fields` when the caller only serializes a few columns: rows then come back as
+        dicts from `.values('pk', *fields)` and no model instances are built.
         
         Args:
-            page: Page number (1-based)
+            page: Page number (1-based), ignored when after_id is given
             per_page: Number of entities per page
+            include_count: Whether to run a COUNT for total_count/total_pages
+            after_id: Keyset cursor; return entities with pk greater than this value
+            fields: Optional field names to project; entities become dicts that include 'pk'
             **filters: Optional filters to apply
             
         Returns:
             Dictionary containing:
-            - entities: List of entities for the current page
-            - total_count: Total number of entities
+            - entities: List of entities (or dicts, with fields) for the current page
+            - total_count: Total number of entities (None unless include_count)
             - page: Current page number
             - per_page: Entities per page
-            - total_pages: Total number of pages
+            - total_pages: Total number of pages (None unless include_count)
             - has_next: Whether there is a next page
             - has_previous: Whether there is a previous page
+            - next_cursor: pk to pass as after_id for the next page (None on the last page)
             
         Raises:
             ValueError: If pagination parameters are invalid
@@ -943,34 +1689,63 @@ class BaseRepository(Repository, Generic[T]):
             if per_page > 1000:  # Reasonable limit
                 raise ValueError(f"Per-page count too large, maximum is 1000, got {per_page}")
             
-            # Get total count
-            total_count = self.count_entities(**filters)
-            
-            # Calculate pagination
-            total_pages = (total_count + per_page - 1) // per_page  # Ceiling division
+            if after_id is not None and (type(after_id) is not int or after_id < 0):
+                raise ValueError(f"after_id must be a non-negative integer, got {after_id}")
+
             offset = (page - 1) * per_page
-            
-            # Get entities for current page
-            if filters:
-                queryset = self.manager.filter_by(**filters)
-                entities = list(queryset[offset:offset + per_page])
+
+            # Count first when totals are requested, so a page past the end costs no row query
+            total_count = total_pages = None
+            if include_count:
+                total_count = self.count_entities(**filters)
+                total_pages = (total_count + per_page - 1) // per_page  # Ceiling division
+
+            queryset = self.manager.filter_by(**filters) if filters else None
+            if fields is not None:
+                projected = self._validate_fields_list(fields, "pagination projection")
+                queryset = queryset if queryset is not None else self.manager.get_all()
+                queryset = queryset.values('pk', *projected)
+
+            # Get entities for current page, plus one row to detect a next page
+            has_next = None
+            if total_count == 0 or (after_id is None and total_count is not None and offset >= total_count):
+                rows = []
+            elif after_id is not None:
+                queryset = queryset if queryset is not None else self._get_queryset()
+                rows = list(queryset.filter(pk__gt=after_id).order_by('pk')[:per_page + 1])
+            elif offset >= self.DEEP_PAGE_OFFSET_THRESHOLD:
+                queryset = self._stably_ordered(queryset if queryset is not None else self._get_queryset())
+                # Reify the page's pks once (index-only scan), then fetch just those rows by pk
+                page_pks = list(queryset.values_list('pk', flat=True)[offset:offset + per_page + 1])
+                rows_by_pk = {self._row_pk(row): row for row in queryset.filter(pk__in=page_pks[:per_page])}
+                rows = [rows_by_pk[pk] for pk in page_pks[:per_page] if pk in rows_by_pk]
+                has_next = len(page_pks) > per_page
+            elif queryset is not None:
+                rows = list(self._stably_ordered(queryset)[offset:offset + per_page + 1])
             else:
-                entities = self._fetch_all_entities(limit=per_page, offset=offset)
-            
+                rows = self._fetch_all_entities(limit=per_page + 1, offset=offset)
+
+            entities = rows[:per_page]
+            if has_next is None:
+                has_next = len(rows) > per_page
+            if total_pages is not None and after_id is None:
+                has_next = page < total_pages
+
             result = {
                 'entities': entities,
                 'total_count': total_count,
                 'page': page,
                 'per_page': per_page,
                 'total_pages': total_pages,
-                'has_next': page < total_pages,
-                'has_previous': page > 1
+                'has_next': has_next,
+                'has_previous': after_id > 0 if after_id is not None else page > 1,
+                'next_cursor': self._row_pk(entities[-1]) if has_next and entities else None
             }
             
-            sanitized_filters = self._sanitize_log_data(filters)
             logger.debug(
-                f"Retrieved page {page} of {self.model.__name__} entities "
-                f"(per_page={per_page}, total={total_count}, filters: {sanitized_filters})"
+                "Retrieved page %d of %s entities (per_page=%d, total=%s, filters: %s)",
+                page, self.model.__name__, per_page, total_count,
+                _LazySanitized(filters, self._sanitize_log_data)
             )
             
             return result
@@ -978,10 +1753,9 @@ class BaseRepository(Repository, Generic[T]):
         except ValueError:
             raise
         except Exception as e:
-            sanitized_filters = self._sanitize_log_data(filters)
             logger.error(
-                f"Failed to get paginated {self.model.__name__} entities "
-                f"(page={page}, per_page={per_page}, filters: {sanitized_filters}): {str(e)}",
+                "Failed to get paginated %s entities (page=%s, per_page=%s, filters: %s): %s",
+                self.model.__name__, page, per_page, _LazySanitized(filters, self._sanitize_log_data), e,
                 exc_info=True
             )
             raise ValueError(f"Pagination failed: {str(e)}") from e
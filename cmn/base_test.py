@@ -1,7 +1,10 @@
 # Built-in
+import copy
 import json
+from contextlib import ExitStack
+from functools import cached_property, lru_cache
 from pathlib import Path
-from typing import Optional, Union, Dict, Any
+from typing import Optional, Union, Dict, Any, ClassVar
 from unittest.mock import MagicMock, patch
 
 # External
@@ -18,6 +21,29 @@ from questionnaire.repo import QuestionnaireRepository
 from questionnaire.models import Questionnaire
 
 
+_FIXTURES_DIR = Path(__file__).resolve().parent / "fixtures"
+
+
+@lru_cache(maxsize=None)
+def _read_fixture(name: str) -> Any:
+    """Read and parse a fixture file once per process."""
+    fixture_path = _FIXTURES_DIR / name
+    if not fixture_path.is_file():
+        raise FileNotFoundError(f"Fixture not found at {fixture_path}")
+    return json.loads(fixture_path.read_text())
+
+
+def _load_fixture(name: str) -> Any:
+    """Return a private copy of a parsed fixture that callers may mutate."""
+    return copy.deepcopy(_read_fixture(name))
+
+
+@lru_cache(maxsize=None)
+def _hash_password(raw_password: str) -> str:
+    """Hash a fixture password once per process; PBKDF2 is deliberately slow."""
+    return make_password(raw_password)
+
+
 class ModelTest(BaseModel):
     """
     Concrete test model for unit testing.
@@ -47,6 +73,29 @@ class TestClassBase(SimpleTestCase):
     don't need database connections or transactions.
     """
 
+    # Stable patch targets shared by every test: patched once per class and reset per test
+    _CLASS_PATCH_TARGETS: ClassVar[Dict[str, str]] = {
+        "commit": "django.db.transaction.commit",
+        "rollback": "django.db.transaction.rollback",
+        "logger": "cmn.base_model.logger",
+        "repo_logger": "cmn.base_repo.logger",
+        "cache": "django.core.cache.cache",
+    }
+
+    # The test model class is immutable, so it is shared rather than reassigned per test
+    real_test_model_as_class: ClassVar[type] = ModelTest
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        """Start the class-level patches and register them for cleanup."""
+        super().setUpClass()
+        stack = ExitStack()
+        cls.addClassCleanup(stack.close)
+        cls._class_mocks = {
+            name: stack.enter_context(patch(target))
+            for name, target in cls._CLASS_PATCH_TARGETS.items()
+        }
+
     def setUp(self) -> None:
         """
         Set up test environment with mocked dependencies.
@@ -74,10 +123,6 @@ class TestClassBase(SimpleTestCase):
         """Set up mocks for database models and instances."""
         # Create real model instances for testing
         self.real_mock_model = ModelTest(name="ModelTest")
-        self.real_test_model_as_class = ModelTest
-
-        # Create mock model with spec for strict interface compliance
-        self.mock_model = MagicMock(spec=ModelTest)
 
     def _setup_database_mocks(self) -> None:
         """Set up mocks for database manager and transactions."""
@@ -85,16 +130,26 @@ class TestClassBase(SimpleTestCase):
         self.real_mock_manager = DBManager()
         self.real_mock_manager.model = MagicMock()
 
-        # Mock manager with spec for interface compliance
-        self.mock_manager = MagicMock(spec=DBManager)
-
         # Mock Django transaction management
-        self.mock_commit = self._start_patch_with_cleanup("django.db.transaction.commit")
-        self.mock_rollback = self._start_patch_with_cleanup("django.db.transaction.rollback")
+        self.mock_commit = self._get_class_mock("commit")
+        self.mock_rollback = self._get_class_mock("rollback")
+
+    # Spec'd mocks introspect every attribute of their spec class, so they are only
+    # built for tests that actually touch them
+    @cached_property
+    def mock_model(self) -> MagicMock:
+        """Mock model with spec for strict interface compliance."""
+        return MagicMock(spec=ModelTest)
+
+    @cached_property
+    def mock_manager(self) -> MagicMock:
+        """Mock manager with spec for interface compliance."""
+        return MagicMock(spec=DBManager)
 
     def _setup_logging_mocks(self) -> None:
         """Set up mocks for logging infrastructure."""
-        self.mock_logger = self._start_patch_with_cleanup("cmn.base_model.logger")
+        self.mock_logger = self._get_class_mock("logger")
+        self.mock_repo_logger = self._get_class_mock("repo_logger")
 
         # Create convenient references to specific log level methods
         self.mock_info_logger = self.mock_logger.info
@@ -103,7 +158,21 @@ class TestClassBase(SimpleTestCase):
 
     def _setup_cache_mocks(self) -> None:
         """Set up mocks for Django cache framework."""
-        self.mock_cache = self._start_patch_with_cleanup("django.core.cache.cache")
+        self.mock_cache = self._get_class_mock("cache")
+
+    def _get_class_mock(self, name: str) -> MagicMock:
+        """
+        Return a class-level mock, cleared of calls and configured behaviour.
+
+        Args:
+            name: Key of the mock in `_CLASS_PATCH_TARGETS`
+
+        Returns:
+            The reset mock object
+        """
+        mock_obj = self._class_mocks[name]
+        mock_obj.reset_mock(return_value=True, side_effect=True)
+        return mock_obj
 
     def _start_patch_with_cleanup(self, target: str) -> MagicMock:
         """
@@ -209,6 +278,7 @@ class TestClassBase(SimpleTestCase):
         self.mock_model.reset_mock()
         self.mock_manager.reset_mock()
         self.mock_logger.reset_mock()
+        self.mock_repo_logger.reset_mock()
         self.mock_commit.reset_mock()
         self.mock_rollback.reset_mock()
         self.mock_cache.reset_mock()
@@ -218,16 +288,27 @@ class BaseApiTestCase(TestCase):
     """
     Base class for API integration tests.
 
-    - On class setup: run all migrations once.
-    - Before each test method: flush all data.
+    - On class setup: seed the admin user once (and the questionnaire fixture
+      when `seed_questionnaire` is set); each test runs in a rolled-back savepoint.
     - Provides self.client for making API requests.
     """
     _admin: Optional[User] = None
     _questionnaire: Optional[Questionnaire] = None
 
+    # Subclasses whose tests all need the questionnaire fixture persisted set this to True
+    seed_questionnaire: ClassVar[bool] = False
+
     client: APIClient = None
 
 
+    @classmethod
+    def setUpTestData(cls) -> None:
+        super().setUpTestData()
+        cls._admin = cls._admin_to_db()
+        if cls.seed_questionnaire:
+            cls._questionnaire = cls._questionnaire_to_db(cls._read_questionnaire_fields())
+
+
     def setUp(self) -> None:
         # Give each test its own client instance
         self.client = APIClient()
@@ -240,61 +321,63 @@ class BaseApiTestCase(TestCase):
 
     def load_admin_in_db(self) -> User:
         """
-        Return a cached admin user, inserting into the DB.
+        Return the admin user seeded in setUpTestData.
         """
-
-        if self._admin is None:
-            self._admin_to_db()
         return self._admin  # type: ignore[return-value]
 
 
-    def _admin_to_db(self) -> None:
+    @classmethod
+    def _admin_to_db(cls) -> User:
         """
-        Load `fixtures/admin_user.json`, create a user via UserRepository,
-        set staff flags and hashed password, then cache it.
+        Load `fixtures/admin.json` and create the admin user via UserRepository
+        with staff flag and hashed password set, in a single INSERT.
         """
         # 1) Load the JSON fixture
-        fixtures_dir = Path(__file__).resolve().parent / "fixtures"
-        with open(fixtures_dir / "admin.json", "r") as f:
-            records = json.load(f)
+        records = _load_fixture("admin.json")
 
         # Assuming a single‑record fixture:
         data = records[0].get("fields")
 
-        # 2) Pull out the raw password
-        raw_password = data.pop("password")
+        # 2) Mark as admin & set hashed password before the insert
+        data["is_staff"] = True
 
-        # 3) Try to find existing user first, otherwise create new one
-        user_repo = UserRepository()
-        try:
-            # Try to get existing user by username first
-            user_queryset = user_repo.manager.filter_by(username=data.get('username'))
-            user = user_queryset.first()
+        # If the fixture password isn't already hashed, hash it now
+        raw_password = data["password"]
+        if not raw_password.startswith("pbkdf2_"):
+            data["password"] = _hash_password(raw_password)
 
-            if not user:
-                # Try to get by email
-                user_queryset = user_repo.manager.filter_by(email=data.get('email'))
-                user = user_queryset.first()
-        except Exception:
-            user = None
+        # 3) Create the user via your repository (handles email, registration_method, etc.)
+        return UserRepository().create_user(**data)
 
-        if not user:
-            # Create the user via your repository (handles email, registration_method, etc.)
-            user = user_repo.create_user(**data)
 
-        # 4) Mark as admin & set hashed password
-        user.is_staff = True
+    @classmethod
+    def _read_questionnaire_fields(cls) -> Dict[str, Any]:
+        """
+        Read the fields of the first record in `fixtures/questionnaire.json`.
 
-        # If the fixture password isn't already hashed, hash it now
-        if not raw_password.startswith("pbkdf2_"):
-            user.password = make_password(raw_password)
-        else:
-            user.password = raw_password
+        Raises:
+            FileNotFoundError: If the fixture file does not exist.
+            ValueError: If the fixture file is empty or malformed.
+        """
+        # Load JSON
+        records = _load_fixture("questionnaire.json")
+        if not records or not isinstance(records, list):
+            raise ValueError("`questionnaire.json` must contain a non‑empty list of records")
 
-        user.save()
+        # Extract the first record's fields
+        fields: Dict[str, Any] = records[0].get("fields", {})
+        if not fields:
+            raise ValueError("No `fields` key found in the first fixture record")
+        return fields
 
-        # 5) Cache for future calls
-        self._admin = user
+
+    @classmethod
+    def _questionnaire_to_db(cls, fields: Dict[str, Any]) -> Questionnaire:
+        """Persist questionnaire fixture fields owned by the seeded admin user."""
+
+        fields = fields.copy()  # Don't modify original fixture data
+        fields['staff_id'] = cls._admin  # Pass the User instance, not the ID
+        return QuestionnaireRepository().create_entity(**fields)
 
 
     def load_questionnaire(self, to_db: bool = False) -> Union[Dict[str, Any], Questionnaire]:
@@ -304,9 +387,9 @@ class BaseApiTestCase(TestCase):
         Args:
             to_db (bool):
                 - If False, return the raw fixture data (a dict of fields).
-                - If True, persist that data via the repository and return
-                  the saved Questionnaire instance. The staff_id will be set
-                  to reference the admin user created by load_admin_in_db().
+                - If True, return the persisted Questionnaire instance. The
+                  staff_id references the admin user seeded in setUpTestData.
+                  Classes with `seed_questionnaire` reuse the instance seeded there.
 
         Returns:
             Union[Dict[str, Any], Questionnaire]: Fixture fields or model instance.
@@ -315,34 +398,14 @@ class BaseApiTestCase(TestCase):
             FileNotFoundError: If the fixture file does not exist.
             ValueError: If the fixture file is empty or malformed.
         """
-        # Locate the fixture
-        fixtures_dir = Path(__file__).resolve().parent / "fixtures"
-        fixture_path = fixtures_dir / "questionnaire.json"
-        if not fixture_path.is_file():
-            raise FileNotFoundError(f"Fixture not found at {fixture_path}")
+        if to_db and self._questionnaire is not None:
+            return self._questionnaire
 
-        # Load JSON
-        records = json.loads(fixture_path.read_text())
-        if not records or not isinstance(records, list):
-            raise ValueError("`questionnaire.json` must contain a non‑empty list of records")
-
-        # Extract the first record's fields
-        fields: Dict[str, Any] = records[0].get("fields", {})
-        if not fields:
-            raise ValueError("No `fields` key found in the first fixture record")
+        fields = self._read_questionnaire_fields()
 
         # Persist if requested
         if to_db:
-            # Ensure we have an admin user and set it as the staff_id
-            admin_user = self.load_admin_in_db()
-            fields = fields.copy()  # Don't modify original fixture data
-            fields['staff_id'] = admin_user  # Pass the User instance, not the ID
-
-            repo = QuestionnaireRepository()
-            instance = repo.create_entity(**fields)
-            return instance
+            return self._questionnaire_to_db(fields)
 
         # Otherwise return raw data
         return fields
-
-        self.mock_cache.reset_mock()
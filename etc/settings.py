@@ -93,6 +93,8 @@ if ENV == "test":
             "PASSWORD": os.getenv("TEST_DB_PASSWORD", "password"),
             "PORT": os.getenv("TEST_DB_PORT", "5432"),
             "HOST": os.getenv("TEST_DB_HOST", "test_db"),
+            # Reads run in autocommit; writes open their own atomic block in the service layer
+            "ATOMIC_REQUESTS": False,
         }
     }
 
@@ -104,7 +106,9 @@ else:
             "USER": os.getenv("DB_USER", "kyc_dev"),
             "PASSWORD": os.getenv("DB_PASSWORD", "password"),
             "PORT": os.getenv("DB_PORT", "5432"),
-            "HOST": os.getenv("DB_HOST", "localhost")
+            "HOST": os.getenv("DB_HOST", "localhost"),
+            # Reads run in autocommit; writes open their own atomic block in the service layer
+            "ATOMIC_REQUESTS": False,
         }
     }
 
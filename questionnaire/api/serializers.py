@@ -1,29 +1,82 @@
+# Built-in
+from collections.abc import Mapping
+from typing import Any, Dict, List
+
 # External
 from rest_framework import serializers
-from rest_framework.validators import UniqueValidator
 
 # Internal
-from questionnaire.models import Questionnaire
+from questionnaire.models import Questionnaire, SCOPE_VALUES, TYPE_VALUES
+from questionnaire.repo import ADMIN_LIST_FIELDS
 
 
-class QuestionnaireForAdminSerializer(serializers.ModelSerializer):
+class QuestionnaireForAdminSerializer(serializers.Serializer):
+    """
+    Read serializer for admin questionnaire responses.
 
-    class Meta:
-        model = Questionnaire
-        fields = '__all__'
+    A plain Serializer, so list rows can be `.values()` dicts rather than model instances;
+    a Questionnaire instance (the create response) is read into the same row shape.
+    """
 
+    id = serializers.IntegerField(read_only=True)
+    name = serializers.CharField(read_only=True)
+    about = serializers.CharField(read_only=True, allow_null=True)
+    questionnaire_type = serializers.CharField(read_only=True)
+    questionnaire_scope = serializers.CharField(read_only=True)
+    staff_id = serializers.IntegerField(source='staff_id_id', read_only=True, allow_null=True)
+    created_at = serializers.DateTimeField(read_only=True)
 
-class QuestionnaireFilterSerializer(serializers.Serializer):
 
-    questionnaire_scope = serializers.ChoiceField(
-        choices=Questionnaire.SCOPE_CHOICES,
-        help_text="Filter by questionnaire scope"
-    )
+    def to_representation(self, instance: Any) -> Dict[str, Any]:
+        """
+        Render a row by key lookup, skipping DRF's per-field attribute walk.
+        `.values()` dicts are used as-is; model instances are read into the same shape.
+        """
+        row = instance if isinstance(instance, Mapping) else {
+            column: getattr(instance, column) for column in ADMIN_LIST_FIELDS
+        }
+
+        created_at = row['created_at']
+        return {
+            'id': row['id'],
+            'name': row['name'],
+            'about': row['about'],
+            'questionnaire_type': row['questionnaire_type'],
+            'questionnaire_scope': row['questionnaire_scope'],
+            'staff_id': row['staff_id_id'],
+            'created_at': None if created_at is None else self.fields['created_at'].to_representation(created_at),
+        }
 
-    questionnaire_type = serializers.ChoiceField(
-        choices=Questionnaire.TYPE_CHOICES,
-        help_text="Filter by questionnaire type"
-    )
+
+# Allowed values for the optional list/export query filters
+_FILTER_CHOICES: Dict[str, frozenset] = {
+    'questionnaire_scope': SCOPE_VALUES,
+    'questionnaire_type': TYPE_VALUES,
+}
+
+
+def validate_filters(query_params: Mapping) -> Dict[str, str]:
+    """
+    Validate the optional scope/type query filters with plain set lookups.
+
+    Equivalent to a serializer with two optional ChoiceFields, without building one per request.
+
+    Raises:
+        ValidationError: With DRF's usual `{field: [message]}` shape for unknown values.
+    """
+    filters: Dict[str, str] = {}
+    errors: Dict[str, list] = {}
+    for name, choices in _FILTER_CHOICES.items():
+        value = query_params.get(name)
+        if value is None:
+            continue
+        if value in choices:
+            filters[name] = value
+        else:
+            errors[name] = [serializers.ChoiceField.default_error_messages['invalid_choice'].format(input=value)]
+    if errors:
+        raise serializers.ValidationError(errors, code='invalid_choice')
+    return filters
 
 
 class QuestionnaireCreateByAdminSerializer(serializers.Serializer):
@@ -31,18 +84,37 @@ class QuestionnaireCreateByAdminSerializer(serializers.Serializer):
     Serializer for admin to create new Questionnaires.
     """
 
+    # Written straight to the FK column; the foreign key enforces that the user exists,
+    # without a SELECT per request
     staff_id = serializers.IntegerField(
+        source='staff_id_id',
         required=True,
         help_text="ID of the staff member creating the questionnaire"
     )
-    name = serializers.CharField(
-        validators=[UniqueValidator(queryset=Questionnaire.objects.all())]
-    )
+    # Uniqueness is enforced by the unique index on Questionnaire.name; the view maps
+    # the IntegrityError to a field error instead of pre-checking with a SELECT
+    name = serializers.CharField(max_length=255)
     about = serializers.CharField(max_length=1000)
 
+    # New questionnaires may only start as the first (default) type and scope
     questionnaire_type = serializers.ChoiceField(
-        choices=Questionnaire.TYPE_CHOICES[0][0]
+        choices=Questionnaire.TYPE_CHOICES[:1]
     )
     questionnaire_scope = serializers.ChoiceField(
-        choices=Questionnaire.SCOPE_CHOICES[0][0]
+        choices=Questionnaire.SCOPE_CHOICES[:1]
+    )
+    # Question IDs in display order; list position becomes order_index
+    questions = serializers.ListField(
+        child=serializers.IntegerField(min_value=1),
+        required=False,
+        help_text="IDs of the questions to attach, in display order"
     )
+
+
+    def validate_questions(self, value: List[int]) -> List[int]:
+        """
+        Reject repeated IDs up front; the (questionnaire, question) unique constraint would fail the INSERT.
+        """
+        if len(set(value)) != len(value):
+            raise serializers.ValidationError("Each question may appear only once.")
+        return value
@@ -1,18 +1,24 @@
 # Built-in
+import json
 from typing import Any
 
 # External
+from django.db import IntegrityError
+from django.http import StreamingHttpResponse
 from rest_framework import viewsets, mixins, status
+from rest_framework.decorators import action
+from rest_framework.exceptions import ValidationError
 from rest_framework.permissions import IsAdminUser
 from rest_framework.request import Request
 from rest_framework.response import Response
 
 
 # Internal
+from questionnaire.repo import QuestionnaireRepository
 from questionnaire.service import AdminQuestionnaireService
 from .serializers import (QuestionnaireForAdminSerializer,
                           QuestionnaireCreateByAdminSerializer,
-                          QuestionnaireFilterSerializer)
+                          validate_filters)
 
 
 class AdminQuestionnaireViewSet(mixins.ListModelMixin, mixins.CreateModelMixin, viewsets.GenericViewSet):
@@ -20,14 +26,16 @@ class AdminQuestionnaireViewSet(mixins.ListModelMixin, mixins.CreateModelMixin,
     ViewSet for admin questionnaire operations.
     
     Provides:
-    - list: GET /admin/questionnaire/ (with optional scope or type filters)
+    - list: GET /admin/questionnaire/ (with optional scope or type filters; an unfiltered
+      count on a large table is a planner estimate, flagged by `count_is_approximate`)
     - create: POST /admin/questionnaire/
+    - export: GET /admin/questionnaire/export/ (newline-delimited JSON, same filters as list)
     """
     permission_classes = [IsAdminUser]
     serializer_class = QuestionnaireForAdminSerializer
-    
-    def _get_serializer_class(self):
 
+
+    def get_serializer_class(self):
         """
         Return appropriate serializer class based on action.
         """
@@ -40,29 +48,50 @@ class AdminQuestionnaireViewSet(mixins.ListModelMixin, mixins.CreateModelMixin,
         """
         GET → delegate the operation to validator, then to service and return Response with serialized results.
         """
-        filter_ser = QuestionnaireFilterSerializer(data=request.query_params)
-        filter_ser.is_valid(raise_exception=True)
-        filters = filter_ser.validated_data
+        filters = validate_filters(request.query_params)
 
-        total, qs = AdminQuestionnaireService.list_questionnaires(
-            questionnaire_scope=filters.get("scope"),
-            questionnaire_type=filters.get("type"),
+        total, approximate, qs = AdminQuestionnaireService.list_questionnaires(
+            questionnaire_scope=filters.get("questionnaire_scope"),
+            questionnaire_type=filters.get("questionnaire_type"),
         )
 
         ser = self.get_serializer(qs, many=True)
         return Response(
-            {"count": total, "results": ser.data},
+            {"count": total, "count_is_approximate": approximate, "results": ser.data},
             status=status.HTTP_200_OK
         )
 
 
+    @action(detail=False, methods=['get'])
+    def export(self, request: Request, *args: Any, **kwargs: Any) -> StreamingHttpResponse:
+        """
+        GET → stream every matching questionnaire as one JSON object per line,
+        keeping memory bounded by the database chunk size rather than the row count.
+        """
+        filters = validate_filters(request.query_params)
+
+        rows = AdminQuestionnaireService.export_questionnaires(
+            questionnaire_scope=filters.get("questionnaire_scope"),
+            questionnaire_type=filters.get("questionnaire_type"),
+        )
+
+        row_ser = QuestionnaireForAdminSerializer()
+        lines = (json.dumps(row_ser.to_representation(row)) + "\n" for row in rows)
+        return StreamingHttpResponse(lines, content_type="application/x-ndjson")
+
+
     def create(self, request: Request, *args: Any, **kwargs: Any) -> Response:
         """
         POST → delegate the operation to serializer, then to Q service and return Response with results.
         """
         write_serializer = self.get_serializer(data=request.data)
         write_serializer.is_valid(raise_exception=True)
-        instance = AdminQuestionnaireService.create_questionnaire(write_serializer.validated_data)
+        try:
+            instance = AdminQuestionnaireService.create_questionnaire(write_serializer.validated_data)
+        except IntegrityError as e:
+            if not QuestionnaireRepository.is_duplicate_name(e):
+                raise
+            raise ValidationError({"name": ["Questionnaire with this name already exists."]})
         
         # Use the read serializer for output
         read_serializer = QuestionnaireForAdminSerializer(instance)
@@ -0,0 +1,49 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('questionnaire', '0002_initial'),
+    ]
+
+    operations = [
+        # Scope/type index widened to cover the admin list's created_at ordering
+        migrations.RemoveIndex(
+            model_name='questionnaire',
+            name='questionnai_questio_0c2535_idx',
+        ),
+        migrations.AddIndex(
+            model_name='questionnaire',
+            index=models.Index(fields=['questionnaire_scope', 'questionnaire_type', '-created_at', 'name'], name='qn_scope_type_recent_idx'),
+        ),
+        # Scope lookups are served by the composite index above
+        migrations.AlterField(
+            model_name='questionnaire',
+            name='questionnaire_scope',
+            field=models.CharField(blank=True, choices=[('draft', 'Draft'), ('public', 'Public'), ('assigned', 'Assigned')], default='draft', help_text='Publication state of the questionnaire.', max_length=20, verbose_name='Scope'),
+        ),
+        # Recent drafts / recent public listings
+        migrations.AddIndex(
+            model_name='questionnaire',
+            index=models.Index(condition=models.Q(('questionnaire_scope', 'draft')), fields=['-created_at'], name='qn_draft_recent_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='questionnaire',
+            index=models.Index(condition=models.Q(('questionnaire_scope', 'public')), fields=['-created_at'], name='qn_public_recent_idx'),
+        ),
+        # Redundant: name's UNIQUE index and the staff_id FK index already cover these
+        migrations.RemoveIndex(
+            model_name='questionnaire',
+            name='questionnai_name_0e2bae_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='questionnaire',
+            name='questionnai_staff_i_42c87b_idx',
+        ),
+        migrations.AlterField(
+            model_name='questionnaire',
+            name='name',
+            field=models.CharField(help_text="Unique identifier for the questionnaire (e.g., 'KYC Form 2025').", max_length=255, unique=True, verbose_name='Name'),
+        ),
+    ]
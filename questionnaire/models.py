@@ -11,8 +11,7 @@ class Questionnaire(BaseModel):
 
     name = models.CharField(
         max_length=255,
-        unique=True,
-        db_index=True,
+        unique=True,  # The UNIQUE constraint already provides the lookup index
         verbose_name=_("Name"),
         help_text=_("Unique identifier for the questionnaire (e.g., 'KYC Form 2025').")
     )
@@ -35,7 +34,6 @@ class Questionnaire(BaseModel):
         max_length=20,
         choices=SCOPE_CHOICES,
         default=SCOPE_CHOICES[0][0],
-        db_index=True,
         blank=True,
         verbose_name=_("Scope"),
         help_text=_("Publication state of the questionnaire.")
@@ -109,9 +107,11 @@ class Questionnaire(BaseModel):
         verbose_name_plural = _("Questionnaires")
         ordering = ['-questionnaire_scope', '-created_at']
         indexes = [
-            models.Index(fields=['questionnaire_scope', 'questionnaire_type']),
-            models.Index(fields=['name', 'questionnaire_scope']),
-            models.Index(fields=['staff_id', 'questionnaire_scope']),
+            # Matches the admin list filter (scope, type) and its created_at ordering
+            models.Index(fields=['questionnaire_scope', 'questionnaire_type', '-created_at', 'name'], name='qn_scope_type_recent_idx'),
+            # Small partial indexes for the common "recent drafts / recent public" admin views
+            models.Index(fields=['-created_at'], name='qn_draft_recent_idx', condition=models.Q(questionnaire_scope='draft')),
+            models.Index(fields=['-created_at'], name='qn_public_recent_idx', condition=models.Q(questionnaire_scope='public')),
         ]
         # admin
         permissions = []
@@ -121,6 +121,11 @@ class Questionnaire(BaseModel):
         return f"{self.name} (Type: {self.questionnaire_type}, Scope: {self.questionnaire_scope})"
 
 
+# Valid stored values, built once at import for O(1) membership checks
+SCOPE_VALUES = frozenset(value for value, _label in Questionnaire.SCOPE_CHOICES)
+TYPE_VALUES = frozenset(value for value, _label in Questionnaire.TYPE_CHOICES)
+
+
 # class QuestionnaireGroup(BaseModel):
 #     """Questionnaires can be grouped in categories."""
 #
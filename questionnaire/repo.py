@@ -1,12 +1,89 @@
 # External
 from __future__ import annotations
+from typing import TYPE_CHECKING
+
+from django.db import IntegrityError, transaction
+from django.db.models import QuerySet
 
 # Internal
 from cmn.base_repo import BaseRepository
-from .models import Questionnaire
+from .models import Questionnaire, QuestionnaireQuestion
+
+if TYPE_CHECKING:
+    from typing import Any, Dict, Iterable, Optional
+
+
+# Columns rendered by the admin read serializer (staff_id as its raw FK column)
+ADMIN_LIST_FIELDS = ('id', 'name', 'about', 'questionnaire_type', 'questionnaire_scope', 'staff_id_id', 'created_at')
+
+# Rows per INSERT when attaching questions to a new questionnaire
+QUESTION_BULK_BATCH_SIZE = 500
+
+# PostgreSQL's name for the UNIQUE constraint declared inline on `name` in 0001_initial
+NAME_UNIQUE_CONSTRAINT = f"{Questionnaire._meta.db_table}_name_key"
 
 
 class QuestionnaireRepository(BaseRepository[Questionnaire]):
     """Repository for handling Questionnaire model operations."""
 
     _model = Questionnaire
+
+
+    @staticmethod
+    def admin_filters(questionnaire_scope: Optional[str] = None,
+                      questionnaire_type: Optional[str] = None) -> Dict[str, str]:
+        """Build ORM filters from the optional admin scope/type values, skipping unset ones."""
+
+        return {
+            field: value
+            for field, value in (('questionnaire_scope', questionnaire_scope),
+                                 ('questionnaire_type', questionnaire_type))
+            if value
+        }
+
+
+    def list_for_admin(self,
+                       questionnaire_scope: Optional[str] = None,
+                       questionnaire_type: Optional[str] = None
+    ) -> QuerySet[Dict[str, Any]]:
+        """Admin list rows as plain dicts with ADMIN_LIST_FIELDS, in the model's default ordering."""
+
+        filters = self.admin_filters(questionnaire_scope, questionnaire_type)
+        queryset = self.manager.filter_by(**filters) if filters else self.manager.get_all()
+        return queryset.values(*ADMIN_LIST_FIELDS)
+
+
+    def create_with_questions(self, data: Dict[str, Any], question_ids: Iterable[int] = ()) -> Questionnaire:
+        """
+        Create a questionnaire and attach its questions in the given order, in one transaction.
+
+        The instance is saved directly rather than through `create_entity`: DBManager.create_instance
+        swallows IntegrityError, and callers need it to tell a duplicate name apart.
+
+        :raises IntegrityError: If a constraint (e.g. the unique name) is violated.
+        """
+
+        # Savepoint so a failed INSERT leaves any outer transaction usable
+        with transaction.atomic():
+            instance = self.model(**data)
+            instance.save()
+
+            # One multi-row INSERT into the through table instead of one per question
+            links = [QuestionnaireQuestion(questionnaire=instance, question_id=question_id, order_index=index)
+                     for index, question_id in enumerate(question_ids)]
+            if links:
+                QuestionnaireQuestion.objects.bulk_create(links, batch_size=QUESTION_BULK_BATCH_SIZE)
+
+        self._invalidate_after_create(instance)
+        return instance
+
+
+    @staticmethod
+    def is_duplicate_name(error: IntegrityError) -> bool:
+        """Whether `error` is the unique-name violation rather than some other constraint failure."""
+
+        # psycopg2 reports the violated constraint; backends without diagnostics only give the message
+        diag = getattr(error.__cause__, 'diag', None)
+        if diag is not None:
+            return diag.constraint_name == NAME_UNIQUE_CONSTRAINT
+        return f"{Questionnaire._meta.db_table}.name" in str(error)
@@ -9,7 +9,7 @@ from django.db.models import QuerySet
 from .repo import QuestionnaireRepository
 
 if TYPE_CHECKING:
-    from typing import Any, Dict, Optional, Tuple
+    from typing import Any, Dict, Iterator, Optional, Tuple
     from .models import Questionnaire
 
 
@@ -20,26 +20,46 @@ class AdminQuestionnaireService:
 
     @staticmethod
     def list_questionnaires(questionnaire_scope: Optional[str] = None,
-                            questionnaire_type: Optional[str] = None) -> Tuple[int, QuerySet[Questionnaire]]:
+                            questionnaire_type: Optional[str] = None) -> Tuple[int, bool, QuerySet[Dict[str, Any]]]:
         """
-        Retrieve questionnaires, optionally filtering by questionnaire scope or type.
+        Retrieve questionnaires, optionally filtering by questionnaire scope and/or type.
 
         :param questionnaire_scope: Optional scope to filter by (e.g., 'draft', 'public', 'assigned').
         :param questionnaire_type: Optional type to filter by (e.g., 'regular', 'verification', 'mandatory').
-        :return: A tuple of (total_count, queryset) where:
+        :return: A tuple of (total_count, approximate, queryset) where:
                  - total_count is the number of matched questionnaires.
-                 - queryset is a Django QuerySet of Questionnaire instances.
+                 - approximate is True when total_count is a planner estimate
+                   (large tables, no filter given).
+                 - queryset is a Django QuerySet of row dicts with ADMIN_LIST_FIELDS.
         """
 
         q_repo = QuestionnaireRepository()
-        queryset = q_repo.manager.get_all()
+        filters = q_repo.admin_filters(questionnaire_scope, questionnaire_type)
+        queryset = q_repo.list_for_admin(questionnaire_scope, questionnaire_type)
 
-        if questionnaire_scope:
-            queryset = queryset.filter(scope=questionnaire_scope)
-        elif questionnaire_type:
-            queryset = queryset.filter(type=questionnaire_type)
+        # Count through the repository so repeat requests for the same filters hit the cache;
+        # the unfiltered total may be a planner estimate on large tables
+        if filters:
+            total, approximate = q_repo.count_entities(**filters), False
+        else:
+            total, approximate = q_repo.estimate_count()
+        return total, approximate, queryset
 
-        return queryset.count(), queryset
+
+    @staticmethod
+    def export_questionnaires(questionnaire_scope: Optional[str] = None,
+                              questionnaire_type: Optional[str] = None,
+                              chunk_size: int = 2000) -> Iterator[Dict[str, Any]]:
+        """
+        Stream questionnaire rows for export without holding the whole result set in memory.
+
+        :param questionnaire_scope: Optional scope to filter by.
+        :param questionnaire_type: Optional type to filter by.
+        :param chunk_size: Rows fetched from the database cursor per round-trip.
+        :return: An iterator of row dicts with ADMIN_LIST_FIELDS.
+        """
+        q_repo = QuestionnaireRepository()
+        return q_repo.list_for_admin(questionnaire_scope, questionnaire_type).iterator(chunk_size=chunk_size)
 
 
     @staticmethod
@@ -47,9 +67,11 @@ class AdminQuestionnaireService:
         """
         Create and persist a new Questionnaire from validated data.
 
-        :param data: Dict of fields matching Questionnaire model.
+        :param data: Dict of fields matching Questionnaire model. An optional `questions`
+                     list of Question ids is attached in the given order.
         :return: The newly created Questionnaire instance.
+        :raises IntegrityError: If a unique constraint (e.g. the name) is violated.
         """
-        repo = QuestionnaireRepository()
-        instance = repo.manager.create_instance(**data)
-        return instance
+        data = dict(data)
+        question_ids = data.pop('questions', None) or ()
+        return QuestionnaireRepository().create_with_questions(data, question_ids)
@@ -1,12 +1,19 @@
 # Built-in
+import json
 from typing import Any, Dict
+from unittest.mock import patch
 
 # External
+from django.db import IntegrityError, connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from rest_framework import status
 
 # Internal
 from cmn.base_test import BaseApiTestCase
+from questionnaire.models import Question, Questionnaire, QuestionnaireQuestion
+from questionnaire.repo import QuestionnaireRepository
+from user.models import User
 
 
 class TestAdminCRUDSingleQuestionnaire(BaseApiTestCase):
@@ -48,10 +55,208 @@ class TestAdminCRUDSingleQuestionnaire(BaseApiTestCase):
             "draft",
             "Expected newly created questionnaire with default scope 'draft'."
         )
+        self.assertTrue(
+            Questionnaire.objects.filter(id=data.get("id"), name=payload["name"]).exists(),
+            "Expected the created questionnaire to be persisted."
+        )
+
+
+    def test_create_questionnaire_with_questions(self) -> None:
+        """
+        GIVEN two stored questions and an authenticated admin,
+        WHEN the admin creates a questionnaire listing them in a chosen order,
+        THEN each question is attached once, with order_index following the list position.
+        """
+        # GIVEN
+        admin = self.load_admin_in_db()
+        first = Question(question_type="text", reference_code="Q_FIRST", text="First question")
+        first.save()
+        second = Question(question_type="number", reference_code="Q_SECOND", text="Second question")
+        second.save()
+        payload: Dict[str, Any] = self.load_questionnaire(to_db=False)
+        payload['staff_id'] = admin.id
+        payload['questions'] = [second.id, first.id]
+
+        url: str = reverse("admin-questionnaire-list")
+        self.client.force_authenticate(user=admin)
+
+        # WHEN
+        response = self.client.post(url, data=payload, format="json")
+
+        # THEN
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(
+            list(QuestionnaireQuestion.objects
+                 .filter(questionnaire_id=response.json()["id"])
+                 .order_by("order_index")
+                 .values_list("question_id", "order_index")),
+            [(second.id, 0), (first.id, 1)],
+            "Expected the questions attached in the submitted order."
+        )
+
+
+    def test_create_questionnaire_with_repeated_question(self) -> None:
+        """
+        GIVEN an authenticated admin and a payload listing the same question twice,
+        WHEN the admin submits a POST,
+        THEN the response is 400 with a `questions` error and nothing is created.
+        """
+        # GIVEN
+        admin = self.load_admin_in_db()
+        question = Question(question_type="text", reference_code="Q_REPEATED", text="Repeated question")
+        question.save()
+        payload: Dict[str, Any] = self.load_questionnaire(to_db=False)
+        payload['staff_id'] = admin.id
+        payload['questions'] = [question.id, question.id]
+
+        url: str = reverse("admin-questionnaire-list")
+        self.client.force_authenticate(user=admin)
+
+        # WHEN
+        response = self.client.post(url, data=payload, format="json")
+
+        # THEN
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("questions", response.json())
+        self.assertFalse(Questionnaire.objects.filter(name=payload["name"]).exists())
+
+
+    def test_create_questionnaire_does_not_look_up_staff(self) -> None:
+        """
+        GIVEN a valid questionnaire payload and an authenticated admin,
+        WHEN the admin submits a POST to create a questionnaire,
+        THEN staff_id is written to the FK column without a SELECT on the user table.
+        """
+        # GIVEN
+        payload: Dict[str, Any] = self.load_questionnaire(to_db=False)
+        admin = self.load_admin_in_db()
+        payload['staff_id'] = admin.id
+
+        url: str = reverse("admin-questionnaire-list")
+        self.client.force_authenticate(user=admin)
+
+        # WHEN
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.post(url, data=payload, format="json")
+
+        # THEN
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.json().get("staff_id"), admin.id)
+        self.assertFalse(
+            [query for query in queries.captured_queries
+             if query["sql"].startswith("SELECT") and User._meta.db_table in query["sql"]],
+            "Expected no lookup of the staff user."
+        )
+
+
+    def test_create_questionnaire_with_duplicate_name(self) -> None:
+        """
+        GIVEN a stored questionnaire and an authenticated admin,
+        WHEN the admin submits a POST with the same name,
+        THEN the unique index rejects it and the response is 400 with a `name` error.
+        """
+        # GIVEN
+        admin = self.load_admin_in_db()
+        existing = self.load_questionnaire(to_db=True)
+        payload: Dict[str, Any] = self.load_questionnaire(to_db=False)
+        payload['staff_id'] = admin.id
+
+        url: str = reverse("admin-questionnaire-list")
+        self.client.force_authenticate(user=admin)
+
+        # WHEN
+        response = self.client.post(url, data=payload, format="json")
+
+        # THEN
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("name", response.json())
+        self.assertEqual(
+            list(Questionnaire.objects.values_list("id", flat=True)),
+            [existing.id],
+            "Expected the duplicate to leave only the original questionnaire."
+        )
+
+
+    def test_create_questionnaire_reraises_other_integrity_errors(self) -> None:
+        """
+        GIVEN an authenticated admin and a create that violates some constraint other than the name,
+        WHEN the admin submits a POST,
+        THEN the IntegrityError propagates instead of being reported as a duplicate name.
+        """
+        # GIVEN
+        admin = self.load_admin_in_db()
+        payload: Dict[str, Any] = self.load_questionnaire(to_db=False)
+        payload['staff_id'] = admin.id
+
+        url: str = reverse("admin-questionnaire-list")
+        self.client.force_authenticate(user=admin)
+        error = IntegrityError('insert or update on table "questionnaire_questionnaire" violates foreign key constraint')
+
+        # WHEN / THEN
+        with patch.object(QuestionnaireRepository, "create_with_questions", side_effect=error):
+            with self.assertRaises(IntegrityError):
+                self.client.post(url, data=payload, format="json")
 
 
     def test_list_questionnaires(self) -> None:
-        pass
+        """
+        GIVEN several questionnaires and an authenticated admin,
+        WHEN the admin lists questionnaires,
+        THEN the response holds all of them and the number of queries
+             does not grow with the number of rows (no N+1).
+        """
+        # GIVEN
+        admin = self.load_admin_in_db()
+        repo = QuestionnaireRepository()
+        for i in range(3):
+            repo.create_entity(
+                name=f"Questionnaire {i}",
+                about="List endpoint questionnaire",
+                questionnaire_type="regular",
+                staff_id=admin,
+            )
+
+        url: str = reverse("admin-questionnaire-list")
+        self.client.force_authenticate(user=admin)
+
+        # WHEN
+        # Row estimate (too small to trust) + exact COUNT + one SELECT for the rows
+        with self.assertNumQueries(3):
+            response = self.client.get(url)
+
+        # THEN
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        data = response.json()
+        self.assertEqual(data.get("count"), 3)
+        self.assertIs(data.get("count_is_approximate"), False)
+        self.assertEqual(
+            {row["staff_id"] for row in data.get("results")},
+            {admin.id},
+            "Expected every listed questionnaire to reference the admin by ID."
+        )
+
+
+    def test_export_questionnaires(self) -> None:
+        """
+        GIVEN a stored questionnaire and an authenticated admin,
+        WHEN the admin requests the export,
+        THEN the response streams one JSON object per questionnaire.
+        """
+        # GIVEN
+        admin = self.load_admin_in_db()
+        questionnaire = self.load_questionnaire(to_db=True)
+
+        url: str = reverse("admin-questionnaire-export")
+        self.client.force_authenticate(user=admin)
+
+        # WHEN
+        response = self.client.get(url)
+
+        # THEN
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response["Content-Type"], "application/x-ndjson")
+        lines = b"".join(response.streaming_content).decode().splitlines()
+        self.assertEqual([json.loads(line)["id"] for line in lines], [questionnaire.id])
 
 
     def test_filter_questionnaires(self) -> None:
@@ -0,0 +1,48 @@
+import django.contrib.postgres.indexes
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('submission', '0002_initial'),
+    ]
+
+    operations = [
+        # Stuck-submission lookups: index only the non-terminal statuses
+        migrations.RemoveIndex(
+            model_name='submission',
+            name='idx_submission_status',
+        ),
+        migrations.AddIndex(
+            model_name='submission',
+            index=models.Index(condition=models.Q(('submission_status__in', ('pending', 'submitted'))), fields=['submission_status', '-submitted_at'], name='idx_submission_status'),
+        ),
+        # A user's submissions by status, newest first; a questionnaire's submissions by status
+        migrations.AddIndex(
+            model_name='submission',
+            index=models.Index(fields=['user', 'submission_status', '-submitted_at'], name='sub_user_status_time_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='submission',
+            index=models.Index(fields=['questionnaire', 'submission_status'], name='sub_q_status_idx'),
+        ),
+        # submitted_at range scans: BRIN block summaries replace the B-tree
+        migrations.RemoveIndex(
+            model_name='submission',
+            name='idx_submitted_at',
+        ),
+        migrations.AddIndex(
+            model_name='submission',
+            index=django.contrib.postgres.indexes.BrinIndex(fields=['submitted_at'], name='sub_submitted_brin', pages_per_range=32),
+        ),
+        # Payload containment (@>) lookups with the smaller jsonb_path_ops opclass
+        migrations.RemoveIndex(
+            model_name='submissionpayload',
+            name='payload_gin_idx',
+        ),
+        migrations.AddIndex(
+            model_name='submissionpayload',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['payload'], name='payload_gin_idx', opclasses=['jsonb_path_ops']),
+        ),
+    ]
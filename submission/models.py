@@ -4,7 +4,7 @@ from __future__ import annotations
 from django.db import models
 from django.utils.translation import gettext_lazy as _
 from django.db.models import Index, Q
-from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.indexes import BrinIndex, GinIndex
 
 
 # Internal
@@ -129,16 +129,32 @@ class Submission(BaseModel):
                 condition=Q(questionnaire_type='verification')
             ),
 
-            # Query most recent submissions (history or audit trails)
-            Index(
+            # Time-range scans for history or audit trails. Rows land in roughly submitted_at
+            # order, so BRIN block summaries stay tight at a fraction of a B-tree's size.
+            # BRIN only prunes ranges; it does not return rows pre-sorted for ORDER BY ... LIMIT
+            BrinIndex(
                 fields=["submitted_at"],
-                name="idx_submitted_at"
+                name="sub_submitted_brin",
+                pages_per_range=32
+            ),
+
+            # Used to detect incomplete/stuck submissions: only non-terminal rows are indexed
+            Index(
+                fields=["submission_status", "-submitted_at"],
+                name="idx_submission_status",
+                condition=Q(submission_status__in=('pending', 'submitted'))
+            ),
+
+            # "My submissions": a user's submissions by status, newest first
+            Index(
+                fields=["user", "submission_status", "-submitted_at"],
+                name="sub_user_status_time_idx"
             ),
 
-            # Used to detect incomplete/stuck submissions
+            # Submissions for one questionnaire, filtered by status
             Index(
-                fields=["submission_status"],
-                name="idx_submission_status"
+                fields=["questionnaire", "submission_status"],
+                name="sub_q_status_idx"
             ),
         ]
 
@@ -166,7 +182,9 @@ class SubmissionPayload(BaseModel):
         ordering = ['-saved_at']
 
         indexes = [
-            GinIndex(fields=['payload'], name='payload_gin_idx'),
+            # jsonb_path_ops: smaller and faster than the default opclass for @> containment,
+            # the only operator run against payloads; lookups by submission use the 1:1 unique index
+            GinIndex(fields=['payload'], name='payload_gin_idx', opclasses=['jsonb_path_ops']),
         ]
 
     def __str__(self):
@@ -0,0 +1,40 @@
+import django.contrib.postgres.indexes
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('user', '0001_initial'),
+    ]
+
+    operations = [
+        # Verified/unverified lookups read pre-sorted by date_joined
+        migrations.RemoveIndex(
+            model_name='user',
+            name='verified_user_lookup_idx',
+        ),
+        migrations.AddIndex(
+            model_name='user',
+            index=models.Index(fields=['is_verified', 'date_joined'], name='verified_joined_idx'),
+        ),
+        # Containment (@>) lookups on metadata
+        migrations.AddIndex(
+            model_name='user',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['metadata'], name='user_metadata_gin_idx', opclasses=['jsonb_path_ops']),
+        ),
+        # Default ordering dropped; listings order explicitly
+        migrations.AlterModelOptions(
+            name='user',
+            options={
+                'permissions': [
+                    ('view_users', 'Ability to list and view user records'),
+                    ('change_user_status', 'Grant or revoke a user’s verification status'),
+                    ('view_submissions', 'See all questionnaire submissions'),
+                    ('approve_submissions', 'Mark verification submissions as approved'),
+                ],
+                'verbose_name': 'User',
+                'verbose_name_plural': 'Users',
+            },
+        ),
+    ]
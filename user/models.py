@@ -7,6 +7,7 @@ from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 from django.db.models.functions import Lower
 from django.contrib.auth.models import AbstractUser
+from django.contrib.postgres.indexes import GinIndex
 
 
 # Internal
@@ -85,6 +86,7 @@ class User(BaseModel, AbstractUser):
     def age_days(self) -> int | None:
         """
         Compute the account age in days since date_joined.
+        For listings, use UserRepository.with_account_age() to compute it in SQL.
 
         :return: Days since join or None if date_joined is unset.
         """
@@ -96,7 +98,8 @@ class User(BaseModel, AbstractUser):
     class Meta:
         verbose_name: str = _('User')
         verbose_name_plural: str = _('Users')
-        ordering: list[str] = ['date_joined']
+        # No default ordering: existence checks, counts and full-table walks skip the sort;
+        # listings order explicitly (see UserRepository)
         app_label = "user"
 
         constraints = [
@@ -108,11 +111,13 @@ class User(BaseModel, AbstractUser):
         ]
 
         indexes = [
-            # Index for efficient lookups by verification status
+            # Verification-status lookups in the default date_joined order, read pre-sorted from the index
             models.Index(
-                fields=['is_verified'],
-                name='verified_user_lookup_idx'
-            )
+                fields=['is_verified', 'date_joined'],
+                name='verified_joined_idx'
+            ),
+            # metadata__contains={...} (@>) lookups on browser/device/geo keys
+            GinIndex(fields=['metadata'], name='user_metadata_gin_idx', opclasses=['jsonb_path_ops']),
         ]
 
         permissions = [
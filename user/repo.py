@@ -1,5 +1,10 @@
 # External
 from __future__ import annotations
+from datetime import timedelta
+
+from django.db.models import DurationField, ExpressionWrapper, F, QuerySet
+from django.db.models.functions import Now
+from django.utils import timezone
 
 # Internal
 from cmn.base_repo import BaseRepository
@@ -13,6 +18,8 @@ if TYPE_CHECKING:
 class UserRepository(BaseRepository[User]):
     """Repository for handling User model operations."""
 
+    _model = User
+
 
     def __init__(self, model: Type[User] = User, cache_enabled: bool = True):
         super().__init__(model=model, cache_enabled=cache_enabled)
@@ -29,27 +36,27 @@ class UserRepository(BaseRepository[User]):
 
 
     def create_user(self, **kwargs) -> Optional[User]:
-        """Create a new user within an atomic transaction and clear cache."""
+        """Create a new user and clear cache."""
         return self.create_entity(**kwargs)
 
 
     def update_user_by_id(self, user_id: int, **kwargs) -> Optional[User]:
-        """Update a user by ID atomically and refresh cache."""
+        """Update a user by ID under a row lock and refresh cache."""
         return self.update_entity(user_id, **kwargs)
 
 
     def delete_user_by_id(self, user_id: int) -> Optional[User]:
-        """Delete a user by ID atomically and clear cache."""
+        """Delete a user by ID and clear cache."""
         return self.delete_entity(user_id)
 
 
     def bulk_create_users(self, users: List[User]) -> List[User]:
-        """Bulk create user instances atomically."""
+        """Bulk create user instances in batches."""
         return self.bulk_create_entities(users)
 
 
     def bulk_update_users(self, users: List[User], fields: List[str]) -> List[User]:
-        """Bulk update user instances atomically."""
+        """Bulk update user instances in batches."""
         return self.bulk_update_entities(users, fields)
 
 
@@ -59,10 +66,25 @@ class UserRepository(BaseRepository[User]):
 
 
     def get_verified_users(self) -> List[User]:
-        """Retrieve all verified users."""
-        return list(self.manager.filter_by(is_verified=True))
+        """Retrieve all verified users, oldest first (read in order from verified_joined_idx)."""
+        return list(self.manager.filter_by(is_verified=True).order_by('date_joined'))
 
 
     def get_unverified_users(self) -> List[User]:
-        """Retrieve all unverified users."""
-        return list(self.manager.filter_by(is_verified=False))
+        """Retrieve all unverified users, oldest first (read in order from verified_joined_idx)."""
+        return list(self.manager.filter_by(is_verified=False).order_by('date_joined'))
+
+
+    def with_account_age(self, min_age_days: Optional[int] = None) -> QuerySet[User]:
+        """
+        Users annotated with `account_age` (now - date_joined, computed by the database).
+
+        Lets listings sort by account age in SQL instead of reading `User.age_days` row by row.
+        `min_age_days` filters on `date_joined` itself, so the condition can use its index.
+        """
+        queryset = self.manager.get_all()
+        if min_age_days is not None:
+            queryset = queryset.filter(date_joined__lte=timezone.now() - timedelta(days=min_age_days))
+        return queryset.annotate(
+            account_age=ExpressionWrapper(Now() - F('date_joined'), output_field=DurationField())
+        ).order_by('date_joined')